@@ -0,0 +1,119 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+# Замеряет скорость расшифровки HLS-сегментов и задержку цикла событий во время скачивания трека.
+# Сеть подменяется: сегменты AES-128 генерируются в памяти, поэтому результат зависит только от процессора.
+#
+# PYTHONPATH=. python benchmarks/downloadDecrypt.py [количество сегментов] [размер сегмента в КБ]
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad
+
+from vkmusix import Client
+from vkmusix.enums import Extension
+from vkmusix.types import Track
+
+segmentsCount = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+segmentSizeInBytes = (int(sys.argv[2]) if len(sys.argv) > 2 else 512) * 1024
+
+key = os.urandom(16)
+
+class Response:
+    def __init__(self, content: bytes, headers: dict = None) -> None:
+        self.content = content
+        self.status_code = 200
+        self.headers = headers or dict()
+
+    @property
+    def text(self) -> str:
+        return self.content.decode()
+
+class FakeWeb:
+    def __init__(self) -> None:
+        self.segments = [
+            AES.new(key, AES.MODE_CBC, bytes(16)).encrypt(pad(os.urandom(segmentSizeInBytes), AES.block_size))
+            for _ in range(segmentsCount)
+        ]
+
+        lines = ["#EXTM3U", '#EXT-X-KEY:METHOD=AES-128,URI="https://host/key.pub"']
+        lines.extend(f"seg-{index}.ts" for index in range(segmentsCount))
+
+        self.playlist = "\n".join(lines).encode()
+
+    async def __call__(self, url: str, *args, **kwargs) -> Response:
+        await asyncio.sleep(0)
+
+        if url.endswith("index.m3u8"):
+            return Response(self.playlist)
+
+        if url.endswith("key.pub"):
+            return Response(key, {"content-type": "application/octet-stream"})
+
+        return Response(self.segments[int(url.rsplit("seg-", 1)[1].split(".")[0])])
+
+async def probeLag(stop: asyncio.Event, lags: list) -> None:
+    while not stop.is_set():
+        startedAt = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - startedAt - 0.001)
+
+async def main() -> None:
+    client = Client(token="benchmark")
+    client._client = FakeWeb()
+
+    track = Track(
+        {
+            "owner_id": 1,
+            "id": 1,
+            "title": "Benchmark",
+            "artist": "VKMusix",
+            "url": "https://host/path/index.m3u8",
+        },
+        client=client,
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Первое скачивание импортирует av и pycryptodome, поэтому в замер не входит
+        await client.download(track=track, filename="warmup", directory=directory, extension=Extension.TS)
+
+        stop = asyncio.Event()
+        lags = list()
+        probe = asyncio.ensure_future(probeLag(stop, lags))
+
+        startedAt = time.perf_counter()
+        await client.download(track=track, directory=directory, extension=Extension.TS)
+        elapsed = time.perf_counter() - startedAt
+
+        stop.set()
+        await probe
+    await client.close()
+
+    lags.sort()
+    sizeInMegabytes = segmentsCount * segmentSizeInBytes / 1024 / 1024
+
+    print(f"Сегментов: {segmentsCount} по {segmentSizeInBytes // 1024} КБ ({sizeInMegabytes:.1f} МБ)")
+    print(f"Скачивание с расшифровкой: {elapsed:.3f} с, {sizeInMegabytes / elapsed:.0f} МБ/с")
+    print(f"Задержка цикла событий: p50 {lags[len(lags) // 2] * 1000:.2f} мс, p99 {lags[int(len(lags) * 0.99)] * 1000:.2f} мс, max {lags[-1] * 1000:.2f} мс")
+
+asyncio.run(main())
\ No newline at end of file
@@ -23,25 +23,10 @@ async def main() -> None:
         if not tracks:
             return
 
-        ownerIds = [track.ownerId for track in tracks]
-        trackIds = [track.trackId for track in tracks]
-
-        batchSize = 343
-        tasks = [
-            client.get(
-                ownerIds=ownerIds[i:i + batchSize],
-                trackIds=trackIds[i:i + batchSize]
-            )
-            for i in range(0, len(tracks), batchSize)
-        ]
-
-        batches = await asyncio.gather(*tasks)
-
-        tracks = [
-            track
-            for batch in batches if batch
-            for track in batch
-        ]
+        tracks = await client.get(
+            ownerIds=[track.ownerId for track in tracks],
+            trackIds=[track.trackId for track in tracks],
+        )
 
         tasks = [
             track.download(
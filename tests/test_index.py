@@ -0,0 +1,96 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+import os
+
+import pytest
+
+from vkmusix.errors import IndexFilenameNotSpecified
+from vkmusix.index import LibraryIndex
+from vkmusix.types import Artist, Track, Playlist
+
+def makeTrack(client, trackId: int, title: str, artist: str, **kwargs) -> Track:
+    return Track({"owner_id": 1, "id": trackId, "title": title, "artist": artist, **kwargs}, client=client)
+
+@pytest.fixture
+def index(client) -> LibraryIndex:
+    index = LibraryIndex(client)
+    index.add(
+        [
+            makeTrack(client, 1, "Легенда о богине гроз", "Pyrokinesis", main_artists=[{"id": "123", "name": "Pyrokinesis"}]),
+            makeTrack(client, 2, "Stronger", "Kanye West"),
+            makeTrack(client, 3, "LARI LARI", "Маленький ярче"),
+        ]
+    )
+    index.add(Playlist({"owner_id": 1, "id": 5, "title": "Мой плейлист", "description": "летний вечер"}, client=client))
+
+    return index
+
+def titles(items: list) -> list:
+    return [item.title for item in items]
+
+def test_searchAllWords(index) -> None:
+    assert titles(index.search("легенда гроз")) == ["Легенда о богине гроз"]
+    assert index.search("легенда kanye") == list()
+
+def test_searchPrefixAndTypo(index) -> None:
+    assert titles(index.search("strong")) == ["Stronger"]
+    assert titles(index.search("stronegr")) == ["Stronger"]
+
+def test_searchFieldAndKinds(index) -> None:
+    assert titles(index.search("artist:kanye")) == ["Stronger"]
+    assert titles(index.search("вечер", kinds=Playlist)) == ["Мой плейлист"]
+    assert index.search("вечер", kinds=Track) == list()
+
+def test_remove(index, client) -> None:
+    track = makeTrack(client, 2, "Stronger", "Kanye West")
+
+    assert track in index
+    assert index.remove(track) == 1
+    assert track not in index
+    assert index.search("stronger") == list()
+
+def test_saveAndLoad(index, client, tmp_path) -> None:
+    filename = str(tmp_path / "library.json")
+    index.save(filename)
+
+    loaded = LibraryIndex(client, filename)
+
+    assert len(loaded) == len(index)
+
+    track, = loaded.search("легенда гроз")
+
+    assert isinstance(track, Track)
+    assert isinstance(track.artists[0], Artist)
+
+    # Восстановленные объекты не должны мешать повторному сохранению
+    loaded.save()
+
+    assert sorted(os.listdir(tmp_path)) == ["library.json"]
+
+def test_saveWithoutFilename(index) -> None:
+    with pytest.raises(IndexFilenameNotSpecified):
+        index.save()
+
+def test_saveRemovesTemporaryFileOnError(index, tmp_path) -> None:
+    index._documents["broken"] = {"kind": "Track", "fields": dict(), "raw": {"value": object()}}
+
+    with pytest.raises(TypeError):
+        index.save(str(tmp_path / "library.json"))
+
+    assert os.listdir(tmp_path) == list()
\ No newline at end of file
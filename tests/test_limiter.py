@@ -0,0 +1,83 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import time
+
+from vkmusix.enums import Priority
+from vkmusix.limiter import TokenBucket
+
+def test_unlimitedDoesNotWait() -> None:
+    async def main() -> float:
+        bucket = TokenBucket()
+        startedAt = time.monotonic()
+
+        for _ in range(1000):
+            await bucket.acquire(1)
+
+        return time.monotonic() - startedAt
+
+    assert asyncio.run(main()) < 0.1
+
+def test_rateIsRespected() -> None:
+    async def main() -> float:
+        bucket = TokenBucket(100)
+        startedAt = time.monotonic()
+
+        for _ in range(20):
+            await bucket.acquire(1)
+
+        return time.monotonic() - startedAt
+
+    assert asyncio.run(main()) >= 0.15
+
+def test_priorityOrder() -> None:
+    async def main() -> list:
+        bucket = TokenBucket(20, 1)
+        order = list()
+
+        async def acquire(name: str, priority: Priority) -> None:
+            await bucket.acquire(1, priority)
+            order.append(name)
+
+        # Ведро изначально пустое, поэтому все запросы ждут и обслуживаются по приоритету, а внутри приоритета — по порядку
+        tasks = [
+            asyncio.ensure_future(acquire(name, priority))
+            for name, priority in [("low1", Priority.Low), ("normal", Priority.Normal), ("high1", Priority.High), ("low2", Priority.Low), ("high2", Priority.High)]
+        ]
+
+        await asyncio.gather(*tasks)
+
+        return order
+
+    assert asyncio.run(main()) == ["high1", "high2", "normal", "low1", "low2"]
+
+def test_setRateReleasesWaiters() -> None:
+    async def main() -> float:
+        bucket = TokenBucket(0.1, 1)
+
+        waiter = asyncio.ensure_future(bucket.acquire(1))
+        await asyncio.sleep(0.05)
+
+        startedAt = time.monotonic()
+        bucket.setRate(None)
+        await waiter
+
+        return time.monotonic() - startedAt
+
+    assert asyncio.run(main()) < 1
\ No newline at end of file
@@ -0,0 +1,66 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+
+from vkmusix.types import Album, Track
+
+@pytest.fixture
+def calls(client) -> list:
+    calls = list()
+
+    async def search(method: str, args: tuple, kind: type) -> list:
+        calls.append((method, args[0]))
+
+        return None if args[0] == "nothing" else [args[0]]
+
+    client._search = search
+
+    return calls
+
+def test_duplicateQueriesShareRequest(client, calls) -> None:
+    results = client.searchMany(["Маленький ярче", "  маленький   ЯРЧЕ ", "Kanye", str()])
+
+    assert results == [["Маленький ярче"], ["Маленький ярче"], ["Kanye"], None]
+    assert calls == [("search", "Маленький ярче"), ("search", "Kanye")]
+
+def test_resultsAreCached(client, calls) -> None:
+    client.searchMany(["Kanye"])
+    client.searchMany(["kanye"])
+
+    assert len(calls) == 1
+
+def test_keyIncludesKindAndLimit(client, calls) -> None:
+    client.searchMany(["Kanye"])
+    client.searchMany(["Kanye"], Album)
+    client.searchMany(["Kanye"], Track, 5)
+
+    assert len(calls) == 3
+
+def test_emptyResultsAreNotCached(client, calls) -> None:
+    client.searchMany(["nothing"])
+    client.searchMany(["nothing"])
+
+    assert len(calls) == 2
+
+def test_zeroTTLDisablesCache(client, calls) -> None:
+    client.searchMany(["Kanye"], cacheTTL=0)
+    client.searchMany(["Kanye"], cacheTTL=0)
+
+    assert len(calls) == 2
+    assert not client._searchCache
\ No newline at end of file
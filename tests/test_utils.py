@@ -0,0 +1,80 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+import random
+
+from vkmusix.utils import planReorder
+
+def applyMoves(currentIds: list, moves: list) -> list:
+    result = list(currentIds)
+
+    for chain in moves:
+        for id, beforeId, afterId in chain:
+            result.remove(id)
+
+            if beforeId is not None:
+                result.insert(result.index(beforeId), id)
+
+            else:
+                result.insert(result.index(afterId) + 1, id)
+
+    return result
+
+def longestIncreasingLength(values: list) -> int:
+    lengths = list()
+
+    for index, value in enumerate(values):
+        lengths.append(1 + max((lengths[previous] for previous in range(index) if values[previous] < value), default=0))
+
+    return max(lengths, default=0)
+
+def test_planReorderKeepsSortedList() -> None:
+    assert planReorder([1, 2, 3], [1, 2, 3]) == list()
+
+def test_planReorderEmpty() -> None:
+    assert planReorder(list(), [1, 2]) == list()
+    assert planReorder([1, 2], list()) == list()
+
+def test_planReorderMovesTail() -> None:
+    moves = planReorder([3, 1, 2], [1, 2, 3])
+
+    assert applyMoves([3, 1, 2], moves) == [1, 2, 3]
+    assert sum(len(chain) for chain in moves) == 1
+
+def test_planReorderFuzz() -> None:
+    generator = random.Random(0)
+
+    for _ in range(500):
+        size = generator.randint(0, 40)
+        currentIds = list(range(size))
+        generator.shuffle(currentIds)
+
+        # Часть нужных треков может отсутствовать, а часть текущих — не входить в нужный порядок
+        desiredIds = generator.sample(range(size + 5), generator.randint(0, size + 5))
+
+        moves = planReorder(currentIds, desiredIds)
+        result = applyMoves(currentIds, moves)
+
+        desiredPositions = {id: position for position, id in enumerate(desiredIds)}
+        currentIdsSet = set(currentIds)
+
+        assert [id for id in result if id in desiredPositions] == [id for id in desiredIds if id in currentIdsSet]
+        assert [id for id in result if id not in desiredPositions] == [id for id in currentIds if id not in desiredPositions]
+
+        present = [desiredPositions[id] for id in currentIds if id in desiredPositions]
+        assert sum(len(chain) for chain in moves) == len(present) - longestIncreasingLength(present)
\ No newline at end of file
@@ -16,6 +16,86 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
 
+class LoopThread:
+    def __init__(self) -> None:
+        from threading import Lock
+
+        self._lock = Lock()
+        self._loop = None
+        self._thread = None
+
+
+    def _run(self, loop: "asyncio.AbstractEventLoop") -> None:
+        import asyncio
+
+        asyncio.set_event_loop(loop)
+
+        try:
+            loop.run_forever()
+
+        finally:
+            tasks = (asyncio.all_tasks if hasattr(asyncio, "all_tasks") else asyncio.Task.all_tasks)(loop)
+
+            for task in tasks:
+                task.cancel()
+
+            if tasks:
+                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+
+    def getLoop(self) -> "asyncio.AbstractEventLoop":
+        import asyncio
+        from threading import Thread
+
+        with self._lock:
+            if not self._loop:
+                self._loop = asyncio.new_event_loop()
+                self._thread = Thread(target=self._run, args=(self._loop,), name="vkmusix", daemon=True)
+                self._thread.start()
+
+            return self._loop
+
+
+    def run(self, coroutine: any) -> any:
+        from asyncio import run_coroutine_threadsafe
+
+        return run_coroutine_threadsafe(coroutine, self.getLoop()).result()
+
+
+    def stop(self) -> None:
+        from threading import current_thread
+
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+
+        if not loop:
+            return
+
+        if current_thread() is thread:
+            loop.call_soon(loop.call_soon, loop.stop)
+
+        else:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+
+
+defaultLoopThread = LoopThread()
+
+
+def getLoopThread(instance: any) -> LoopThread:
+    for obj in (instance, getattr(instance, "_client", None)):
+        loopThread = getattr(obj, "_loopThread", None)
+
+        if isinstance(loopThread, LoopThread):
+            return loopThread
+
+    return defaultLoopThread
+
+
 class SyncToAsync:
     from functools import partial
 
@@ -30,25 +110,15 @@ class SyncToAsync:
 
 
     def __call__(self, instance: any, *args: any, **kwargs: any) -> any:
-        from asyncio import get_event_loop, new_event_loop, set_event_loop
+        from asyncio import get_running_loop
 
         try:
-            loop = get_event_loop()
-            if loop.is_running():
-                return self.func(instance, *args, **kwargs)
-
-            else:
-                return loop.run_until_complete(self.func(instance, *args, **kwargs))
+            get_running_loop()
 
         except RuntimeError:
-            newLoop = new_event_loop()
-            set_event_loop(newLoop)
-            result = newLoop.run_until_complete(self.func(instance, *args, **kwargs))
-            newLoop.close()
-            return result
+            return getLoopThread(instance).run(self.func(instance, *args, **kwargs))
 
-        finally:
-            set_event_loop(loop)
+        return self.func(instance, *args, **kwargs)
 
 
 def async_(func: any) -> any:
@@ -17,12 +17,14 @@
 #  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
 
 from typing import Union, List, Type
+from collections import OrderedDict
 import asyncio
 import base64
 
 import httpx
 
 from vkmusix import config, enums, errors, methods, web, aio
+from vkmusix.limiter import TokenBucket
 
 class Client(methods.Methods):
     """
@@ -33,6 +35,9 @@ class Client(methods.Methods):
         RuCaptchaKey (str, optional): Ключ доступа к RuCaptcha API для автоматического решения капч через этот сервис. Если не указан, капча потребует ручного решения.\n
         language (enums.Language, optional): Язык ошибок (например, Language.Russian для русского, Language.English для английского). Если не указан, используются все языки.\n
         proxy (dict, optional): Прокси, которые будут использоваться при запросах. Формат: {"http": "IP:port"} или {"socks5": "login:password@IP:port"}.\n
+        downloadLimit (int, optional): Ограничение скорости скачивания для всех запросов клиента в байтах в секунду. Если не указано, скорость не ограничивается.\n
+        uploadLimit (int, optional): Ограничение скорости отправки для всех запросов клиента в байтах в секунду. Если не указано, скорость не ограничивается.\n
+        requestsPerSecond (float, optional): Максимальное количество запросов к ВКонтакте API в секунду для всего клиента. Лишние запросы ждут своей очереди, а не завершаются ошибкой. Если не указано, количество запросов не ограничивается, а запросы, отклонённые ВКонтакте из-за превышения частоты, повторяются с нарастающей задержкой.\n
 
     Создания экземпляра:
         from vkmusix import Client
@@ -60,10 +65,23 @@ class Client(methods.Methods):
             },
         ) as client:
             ...
+
+    Многопоточность:
+        Один экземпляр `Client` можно использовать из любого количества потоков (например, воркеров Django или Flask или `ThreadPoolExecutor`). Синхронные вызовы из всех потоков выполняются в одном фоновом цикле событий клиента, поэтому потоки разделяют пул соединений, кеш и ограничения `requestsPerSecond`, `downloadLimit` и `uploadLimit`. Не смешивайте синхронное использование одного клиента с асинхронным из собственного цикла событий.
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        client = Client(
+            token="...",
+            requestsPerSecond=3,
+        )
+
+        with ThreadPoolExecutor(16) as executor:
+            tracks = list(executor.map(lambda query: client.searchTracks(query), queries))
     """
 
 
-    def __init__(self, token: str = None, RuCaptchaKey: str = None, language: enums.Language = None, proxy: dict = None) -> None:
+    def __init__(self, token: str = None, RuCaptchaKey: str = None, language: enums.Language = None, proxy: dict = None, downloadLimit: int = None, uploadLimit: int = None, requestsPerSecond: float = None) -> None:
         self._language = language if language and isinstance(language, enums.Language) else None
 
         import sys
@@ -107,8 +125,14 @@ class Client(methods.Methods):
 
             self._proxy = newProxy
 
+        self._downloadLimiter = TokenBucket(downloadLimit)
+        self._uploadLimiter = TokenBucket(uploadLimit)
+        self._requestLimiter = TokenBucket(requestsPerSecond)
+
+        self._loopThread = aio.LoopThread()
+
         self._session = httpx.AsyncClient(proxies=self._proxy)
-        self._client = web.Client(self._session)
+        self._client = web.Client(self._session, self._downloadLimiter, self._uploadLimiter, self._loopThread)
 
         self._params = {
             "access_token": token,
@@ -116,6 +140,11 @@ class Client(methods.Methods):
         }
         self._closed = False
         self._me = None
+        self._meFuture = None
+        self._downloads = dict()
+        self._lyricsCache = OrderedDict()
+        self._playlistTrackCounts = OrderedDict()
+        self._searchCache = OrderedDict()
 
         try:
             asyncio.get_running_loop()
@@ -203,6 +232,8 @@ class Client(methods.Methods):
         self._closed = True
         await self._session.aclose()
 
+        self._loopThread.stop()
+
 
     @aio.async_
     async def reconnect(self) -> None:
@@ -216,13 +247,52 @@ class Client(methods.Methods):
 
         self._closed = False
         self._session = httpx.AsyncClient(proxies=self._proxy)
-        self._client = web.Client(self._session)
+        self._client = web.Client(self._session, self._downloadLimiter, self._uploadLimiter, self._loopThread)
+
+
+    @aio.async_
+    async def setBandwidthLimit(self, downloadLimit: Union[int, None] = str(), uploadLimit: Union[int, None] = str()) -> None:
+        """
+        Изменяет ограничения скорости скачивания и отправки для всех запросов клиента. Действует сразу, в том числе для уже выполняющихся загрузок.
+
+        :param downloadLimit: ограничение скорости скачивания в байтах в секунду. ``None`` для снятия ограничения. (``Union[int, None]``, `optional`)
+        :param uploadLimit: ограничение скорости отправки в байтах в секунду. ``None`` для снятия ограничения. (``Union[int, None]``, `optional`)
+        """
+
+        if downloadLimit != str():
+            self._downloadLimiter.setRate(downloadLimit)
+
+        if uploadLimit != str():
+            self._uploadLimiter.setRate(uploadLimit)
+
+
+    @aio.async_
+    async def setRequestLimit(self, requestsPerSecond: Union[float, None]) -> None:
+        """
+        Изменяет максимальное количество запросов к ВКонтакте API в секунду для всего клиента. Действует сразу, в том числе для запросов, ожидающих своей очереди.
+
+        :param requestsPerSecond: количество запросов в секунду. ``None`` для снятия ограничения. (``Union[float, None]``)
+        """
+
+        self._requestLimiter.setRate(requestsPerSecond)
 
 
     @aio.async_
     async def _getMyId(self) -> int:
         if not self._me:
-            self._me = await self.getMe()
+            if not self._meFuture:
+                self._meFuture = asyncio.ensure_future(self.getMe())
+
+            meFuture = self._meFuture
+
+            try:
+                me = await asyncio.shield(meFuture)
+
+            finally:
+                if self._meFuture is meFuture and meFuture.done():
+                    self._meFuture = None
+
+            self._me = self._me or me
 
         return self._me.get("id")
 
@@ -260,16 +330,23 @@ class Client(methods.Methods):
         if version:
             fullParams["v"] = version
 
-        response = await self._client(
-            url,
-            fullParams,
-            json,
-            data,
-            cookies,
-            headers,
-            files,
-            method=httpMethod if httpMethod and isinstance(httpMethod, web.Method) else web.Method.GET,
-        )
+        async def send() -> any:
+            await self._requestLimiter.acquire(1, enums.Priority.High)
+
+            return await self._client(
+                url,
+                fullParams,
+                json,
+                data,
+                cookies,
+                headers,
+                files,
+                method=httpMethod if httpMethod and isinstance(httpMethod, web.Method) else web.Method.GET,
+                priority=enums.Priority.High,
+            )
+
+        response = await send()
+        rateLimitAttempts = 0
 
         while True:
             if not response or not isinstance(response, dict):
@@ -289,6 +366,13 @@ class Client(methods.Methods):
             elif errorCode == 5:
                 self._raiseError("VKInvalidToken")
 
+            elif errorCode == 6 and rateLimitAttempts < config.rateLimitRetries:
+                # Превышение количества запросов в секунду временно: запрос повторяется с нарастающей задержкой
+                await asyncio.sleep(config.rateLimitBackoffInSeconds * 2 ** rateLimitAttempts)
+                rateLimitAttempts += 1
+
+                response = await send()
+
             elif errorCode in [6, 9]:
                 self._raiseError("tooHighRequestSendingRate")
 
@@ -301,7 +385,8 @@ class Client(methods.Methods):
                     solve = await self._solveCaptcha(captchaUrl)
 
                 else:
-                    solve = input(captchaUrl + "\nВведите решение капчи: ")
+                    # Ввод ждёт в отдельном потоке, чтобы не останавливать общий цикл событий и запросы из других потоков
+                    solve = await asyncio.get_running_loop().run_in_executor(None, input, captchaUrl + "\nВведите решение капчи: ")
 
                 fullParams.update(
                     {
@@ -310,7 +395,7 @@ class Client(methods.Methods):
                     }
                 )
 
-                response = await self._client(url, fullParams)
+                response = await send()
 
             elif errorCode in [15, 201, 203]:
                 if ": can not restore too late" in errorMessage:
@@ -408,6 +493,8 @@ class Client(methods.Methods):
             "sessionClosed": errors.SessionClosed,
             "sessionAlreadyClosed": errors.SessionAlreadyClosed,
             "sessionAlreadyOpened": errors.SessionAlreadyOpened,
+            "syncIterationInsideEventLoop": errors.SyncIterationInsideEventLoop,
+            "lazyHydrationInsideEventLoop": errors.LazyHydrationInsideEventLoop,
 
             "VKInvalidToken": errors.VKInvalidToken,
 
@@ -427,8 +514,12 @@ class Client(methods.Methods):
 
             "noneQuery": errors.NoneQuery,
 
+            "indexFilenameNotSpecified": errors.IndexFilenameNotSpecified,
+
             "ownerIdsAndTrackIdsTypeDifferent": errors.OwnerIdsAndTrackIdsTypeDifferent,
             "ownerIdsAndTrackIdsLenDifferent": errors.OwnerIdsAndTrackIdsLenDifferent,
+            "ownerIdsAndPlaylistIdsLenDifferent": errors.OwnerIdsAndPlaylistIdsLenDifferent,
+            "artistsAndTitlesLenDifferent": errors.ArtistsAndTitlesLenDifferent,
 
             "trackReorderNeedsBeforeOrAfterArgument": errors.TrackReorderNeedsBeforeOrAfterArgument,
             "trackReorderNeedsOnlyBeforeOrAfterNotBoth": errors.TrackReorderNeedsOnlyBeforeOrAfterNotBoth,
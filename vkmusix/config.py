@@ -20,6 +20,9 @@ VK = "https://vk.com/"
 VKAPI = "https://api.vk.com/method/"
 VKAPIVersion = 5.199
 
+rateLimitRetries = 4
+rateLimitBackoffInSeconds = 0.5
+
 RuCaptchaAPI = "https://api.rucaptcha.com/"
 
 headers = {
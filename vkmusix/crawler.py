@@ -0,0 +1,116 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Union, List, AsyncIterator
+import asyncio
+
+from vkmusix.paginator import Paginator
+
+class SectionCrawler(Paginator):
+    """
+    Ленивый обход дерева разделов музыки owner'а (пользователь или группа). Разделы, подразделы и следующие части разделов (``nextOffset``) запрашиваются одновременно, но не более ``concurrency`` запросов за раз; следующая часть раздела запрашивается сразу, как только становится известен её оффсет. Треки и плейлисты, встречающиеся в нескольких разделах, выдаются один раз. Поддерживает как ``for``, так и ``async for``.
+
+    `Пример использования`:
+
+    for item in client.crawlSections(maxItems=500):
+        print(item)
+    """
+
+    def __init__(self, client: "Client", ownerId: int = None, depth: int = 2, maxItems: int = None, concurrency: int = 4, hydrate: bool = False) -> None:
+        super().__init__(client, None, maxItems)
+
+        self.ownerId = ownerId
+        self.depth = depth
+        self.concurrency = concurrency
+        self.hydrate = hydrate
+
+
+    async def pages(self) -> AsyncIterator[List[any]]:
+        from vkmusix.types import Track
+
+        client = self._client
+        semaphore = asyncio.Semaphore(self.concurrency if self.concurrency and self.concurrency > 0 else 1)
+
+        pending = set()
+        seenSections = set()
+        seenItems = set()
+        fetched = 0
+
+        async def fetch(sectionId: str, offset: Union[str, None], level: int) -> tuple:
+            async with semaphore:
+                return await client.getSection(sectionId, offset), sectionId, offset, level
+
+        def schedule(sectionId: Union[str, None], offset: Union[str, None], level: int) -> None:
+            if not sectionId or (sectionId, offset) in seenSections:
+                return
+
+            seenSections.add((sectionId, offset))
+            pending.add(asyncio.ensure_future(fetch(sectionId, offset, level)))
+
+        for section in await client.getSections(self.ownerId) or list():
+            schedule(section.id, None, 0)
+
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                pending.difference_update(done)
+
+                for task in done:
+                    section, sectionId, offset, level = task.result()
+
+                    if not section:
+                        continue
+
+                    if section.nextOffset and section.nextOffset != offset:
+                        schedule(sectionId, section.nextOffset, level)
+
+                    subsections = section.subsections or list()
+
+                    if level < self.depth:
+                        for subsection in subsections:
+                            schedule(subsection.id, None, level + 1)
+
+                    items = list()
+
+                    for block in [section, *subsections]:
+                        for item in [*(block.tracks or list()), *(block.playlists or list()), *(block.recommendedPlaylists or list())]:
+                            key = (type(item).__name__, item.id)
+
+                            if key in seenItems:
+                                continue
+
+                            seenItems.add(key)
+                            items.append(item)
+
+                    if self.limit:
+                        items = items[:self.limit - fetched]
+
+                    if self.hydrate:
+                        await client.hydrate([item for item in items if isinstance(item, Track)])
+
+                    fetched += len(items)
+
+                    if items:
+                        yield items
+
+                    if self.limit and fetched >= self.limit:
+                        return
+
+        finally:
+            for task in pending:
+                task.cancel()
\ No newline at end of file
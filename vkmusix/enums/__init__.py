@@ -18,4 +18,5 @@
 
 from .language import Language
 from .playlistType import PlaylistType
-from .extension import Extension
\ No newline at end of file
+from .extension import Extension
+from .priority import Priority
\ No newline at end of file
@@ -22,6 +22,8 @@ from .unknown import Unknown
 from .sessionClosed import SessionClosed
 from .sessionAlreadyClosed import SessionAlreadyClosed
 from .sessionAlreadyOpened import SessionAlreadyOpened
+from .syncIterationInsideEventLoop import SyncIterationInsideEventLoop
+from .lazyHydrationInsideEventLoop import LazyHydrationInsideEventLoop
 
 from .vkInvalidToken import VKInvalidToken
 
@@ -43,6 +45,8 @@ from .noneQuery import NoneQuery
 
 from .ownerIdsAndTrackIdsTypeDifferent import OwnerIdsAndTrackIdsTypeDifferent
 from .ownerIdsAndTrackIdsLenDifferent import OwnerIdsAndTrackIdsLenDifferent
+from .ownerIdsAndPlaylistIdsLenDifferent import OwnerIdsAndPlaylistIdsLenDifferent
+from .artistsAndTitlesLenDifferent import ArtistsAndTitlesLenDifferent
 
 from .trackReorderNeedsBeforeOrAfterArgument import TrackReorderNeedsBeforeOrAfterArgument
 from .trackReorderNeedsOnlyBeforeOrAfterNotBoth import TrackReorderNeedsOnlyBeforeOrAfterNotBoth
@@ -53,4 +57,6 @@ from .mp3FileTooBig import MP3FileTooBig
 from .tooHighRequestSendingRate import TooHighRequestSendingRate
 
 from .invalidProxyType import InvalidProxyType
-from .invalidProxyDict import InvalidProxyDict
\ No newline at end of file
+from .invalidProxyDict import InvalidProxyDict
+
+from .indexFilenameNotSpecified import IndexFilenameNotSpecified
\ No newline at end of file
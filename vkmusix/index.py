@@ -0,0 +1,401 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Union, List, Dict, Set, Iterable
+from bisect import bisect_left
+import json
+import os
+
+from vkmusix.utils import normalizeText, transliterationTable
+
+class LibraryIndex:
+    """
+    Локальный полнотекстовый индекс по трекам, альбомам и плейлистам. Поиск выполняется без обращений к ВКонтакте: поддерживаются поиск по префиксу, опечатки (одна ошибка в слове от 4 символов) и поиск по отдельным полям (``title``, ``artist``, ``album``, ``description``) в виде ``artist:пирокинезис``. Кириллица и латиница сопоставляются через транслитерацию. Индекс обновляется по мере добавления объектов и может быть сохранён в JSON-файл.
+
+    `Пример использования`:
+
+    index = client.buildLibraryIndex(
+        filename="library.json",
+    )
+
+    print(index.search("artist:маленький lari"))
+
+    index.add(client.searchTracks("LARI LARI"))
+    index.save()
+    """
+
+    fields = ("title", "artist", "album", "description")
+    typoMinLength = 4
+
+    def __init__(self, client: "Client", filename: str = None) -> None:
+        self._client = client
+        self.filename = filename
+
+        self._objects = dict()
+        self._documents = dict()
+        self._postings = dict()
+        self._deletes = dict()
+        self._sortedTokens = None
+
+        if filename and os.path.isfile(filename):
+            self.load(filename)
+
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+
+    def __contains__(self, item: any) -> bool:
+        return self._key(item) in self._documents
+
+
+    @staticmethod
+    def _key(item: any) -> str:
+        return f"{type(item).__name__}:{item.id}" if not isinstance(item, str) else item
+
+
+    @staticmethod
+    def _tokenize(value: Union[str, None]) -> List[str]:
+        return normalizeText(value).translate(transliterationTable).split()
+
+
+    @staticmethod
+    def _getFields(item: any) -> Dict[str, str]:
+        values = {
+            "title": [getattr(item, "title", None), getattr(item, "subtitle", None)],
+            "artist": [getattr(item, "artist", None)] + [artist.nickname for artist in (getattr(item, "artists", None) or list()) + (getattr(item, "featuredArtists", None) or list()) if getattr(artist, "nickname", None)],
+            "album": [getattr(getattr(item, "album", None), "title", None)],
+            "description": [getattr(item, "description", None)],
+        }
+
+        return {
+            field: " ".join(str(value) for value in fieldValues if value)
+            for field, fieldValues in values.items()
+            if any(fieldValues)
+        }
+
+
+    @staticmethod
+    def _deletions(token: str) -> Set[str]:
+        return {token[:i] + token[i + 1:] for i in range(len(token))}
+
+
+    def _indexDocument(self, key: str, document: dict) -> None:
+        self._documents[key] = document
+
+        for field, value in document["fields"].items():
+            for token in self._tokenize(value):
+                postings = self._postings.get(token)
+
+                if postings is None:
+                    postings = self._postings[token] = dict()
+                    self._sortedTokens = None
+
+                    if len(token) >= self.typoMinLength:
+                        for deletion in self._deletions(token):
+                            self._deletes.setdefault(deletion, set()).add(token)
+
+                postings.setdefault(key, set()).add(field)
+
+
+    def _unindexDocument(self, key: str) -> None:
+        document = self._documents.pop(key, None)
+        self._objects.pop(key, None)
+
+        if not document:
+            return
+
+        for value in document["fields"].values():
+            for token in self._tokenize(value):
+                postings = self._postings.get(token)
+
+                if postings is None:
+                    continue
+
+                postings.pop(key, None)
+
+                if not postings:
+                    del self._postings[token]
+                    self._sortedTokens = None
+
+                    if len(token) >= self.typoMinLength:
+                        for deletion in self._deletions(token):
+                            tokens = self._deletes.get(deletion)
+
+                            if tokens:
+                                tokens.discard(token)
+
+                                if not tokens:
+                                    del self._deletes[deletion]
+
+
+    def add(self, items: Union[Iterable[any], any]) -> int:
+        """
+        Добавляет объекты в индекс или обновляет уже добавленные.
+
+        :param items: треки, альбомы и (или) плейлисты. (``Union[list[Union[types.Track, types.Album, types.Playlist]], types.Track, types.Album, types.Playlist]``)
+        :return: количество добавленных или обновлённых объектов (``int``).
+        """
+
+        if items is None:
+            return 0
+
+        if not isinstance(items, (list, tuple, set)) and not hasattr(items, "__next__"):
+            items = [items]
+
+        count = 0
+
+        for item in items:
+            if item is None or getattr(item, "id", None) is None:
+                continue
+
+            key = self._key(item)
+
+            self._unindexDocument(key)
+            self._indexDocument(
+                key,
+                {
+                    "kind": type(item).__name__,
+                    "fields": self._getFields(item),
+                    "raw": self._copyRaw(getattr(item, "raw", None)),
+                },
+            )
+            self._objects[key] = item
+
+            count += 1
+
+        return count
+
+
+    def remove(self, items: Union[Iterable[any], any]) -> int:
+        """
+        Удаляет объекты из индекса.
+
+        :param items: треки, альбомы и (или) плейлисты или их ключи вида ``Track:{ownerId}_{trackId}``. (``Union[list, types.Track, types.Album, types.Playlist, str]``)
+        :return: количество удалённых объектов (``int``).
+        """
+
+        if not isinstance(items, (list, tuple, set)):
+            items = [items]
+
+        count = 0
+
+        for item in items:
+            key = self._key(item)
+
+            if key in self._documents:
+                self._unindexDocument(key)
+                count += 1
+
+        return count
+
+
+    def _match(self, token: str, prefix: bool) -> Dict[str, float]:
+        matches = dict()
+
+        if token in self._postings:
+            matches[token] = 1.0
+
+        if prefix:
+            if self._sortedTokens is None:
+                self._sortedTokens = sorted(self._postings)
+
+            index = bisect_left(self._sortedTokens, token)
+
+            while index < len(self._sortedTokens) and self._sortedTokens[index].startswith(token):
+                matches.setdefault(self._sortedTokens[index], 0.8)
+                index += 1
+
+        if len(token) >= self.typoMinLength:
+            # Кандидаты с расстоянием не больше 1 находятся через общие варианты с одним удалённым символом
+            candidates = set(self._deletes.get(token, set()))
+
+            for deletion in self._deletions(token):
+                if deletion in self._postings:
+                    candidates.add(deletion)
+
+                candidates.update(self._deletes.get(deletion, set()))
+
+            for candidate in candidates:
+                if candidate not in matches and self._isOneEditAway(token, candidate):
+                    matches[candidate] = 0.6
+
+        return matches
+
+
+    @staticmethod
+    def _isOneEditAway(first: str, second: str) -> bool:
+        if abs(len(first) - len(second)) > 1:
+            return False
+
+        if len(first) == len(second):
+            differences = [i for i in range(len(first)) if first[i] != second[i]]
+
+            return len(differences) == 1 or (len(differences) == 2 and differences[1] == differences[0] + 1 and first[differences[0]] == second[differences[1]] and first[differences[1]] == second[differences[0]])
+
+        if len(first) > len(second):
+            first, second = second, first
+
+        for i in range(len(first)):
+            if first[i] != second[i]:
+                return first[i:] == second[i + 1:]
+
+        return True
+
+
+    @classmethod
+    def _copyRaw(cls, raw: any) -> any:
+        # Типы заменяют вложенные списки в raw своими объектами (например, артистов трека), поэтому хранится копия в исходном виде
+        if isinstance(raw, dict):
+            return {key: cls._copyRaw(value) for key, value in raw.items()}
+
+        if isinstance(raw, (list, tuple)):
+            return [cls._copyRaw(value) for value in raw]
+
+        if hasattr(raw, "raw"):
+            return cls._copyRaw(raw.raw)
+
+        return raw
+
+
+    def _getObject(self, key: str) -> any:
+        item = self._objects.get(key)
+
+        if item is None:
+            from vkmusix import types
+
+            document = self._documents[key]
+            itemClass = getattr(types, document["kind"], None)
+
+            item = self._client._finalizeResponse(self._copyRaw(document["raw"]), itemClass) if itemClass and document["raw"] is not None else document["raw"]
+            self._objects[key] = item
+
+        return item
+
+
+    def search(self, query: str, kinds: Union[List[type], type] = None, limit: int = 20) -> List[any]:
+        """
+        Ищет объекты в индексе. Все слова запроса должны найтись; последнее слово ищется также по префиксу, а слова от 4 символов — с одной опечаткой. Слово вида ``поле:значение`` ищется только в указанном поле.
+
+        :param query: поисковой запрос. (``str``)
+        :param kinds: нужные типы объектов, например ``types.Track``. По умолчанию все. (``Union[list[type], type]``, `optional`)
+        :param limit: лимит результатов. По умолчанию ``20``. (``int``, `optional`)
+        :return: найденные объекты, начиная с наиболее подходящих (``list[Union[types.Track, types.Album, types.Playlist]]``).
+        """
+
+        if kinds and not isinstance(kinds, list):
+            kinds = [kinds]
+
+        kindNames = {kind.__name__ for kind in kinds} if kinds else None
+
+        terms = list()
+
+        for part in (query or str()).split():
+            field, separator, value = part.partition(":")
+
+            if separator and field in self.fields:
+                terms.extend((field, token) for token in self._tokenize(value))
+
+            else:
+                terms.extend((None, token) for token in self._tokenize(part))
+
+        if not terms:
+            return list()
+
+        scores = None
+
+        for termIndex, (field, token) in enumerate(terms):
+            termScores = dict()
+
+            for matchedToken, weight in self._match(token, termIndex == len(terms) - 1).items():
+                for key, keyFields in self._postings[matchedToken].items():
+                    if field and field not in keyFields:
+                        continue
+
+                    if kindNames and self._documents[key]["kind"] not in kindNames:
+                        continue
+
+                    if weight > termScores.get(key, 0):
+                        termScores[key] = weight
+
+            if scores is None:
+                scores = termScores
+
+            else:
+                scores = {
+                    key: score + termScores[key]
+                    for key, score in scores.items()
+                    if key in termScores
+                }
+
+            if not scores:
+                return list()
+
+        keys = sorted(scores, key=lambda key: -scores[key])[:limit]
+
+        return [self._getObject(key) for key in keys]
+
+
+    def save(self, filename: str = None) -> None:
+        """
+        Сохраняет индекс в JSON-файл. Запись атомарна: сначала создаётся временный файл.
+
+        :param filename: путь к файлу. По умолчанию путь, переданный при создании индекса. (``str``, `optional`)
+        """
+
+        filename = filename or self.filename
+
+        if not filename:
+            self._client._raiseError("indexFilenameNotSpecified")
+
+        try:
+            with open(f"{filename}.tmp", "w", encoding="utf-8") as file:
+                json.dump(self._documents, file, ensure_ascii=False)
+
+            os.replace(f"{filename}.tmp", filename)
+
+        except BaseException:
+            if os.path.isfile(f"{filename}.tmp"):
+                os.remove(f"{filename}.tmp")
+
+            raise
+
+        self.filename = filename
+
+
+    def load(self, filename: str = None) -> None:
+        """
+        Загружает индекс из JSON-файла, заменяя текущее содержимое.
+
+        :param filename: путь к файлу. По умолчанию путь, переданный при создании индекса. (``str``, `optional`)
+        """
+
+        filename = filename or self.filename
+
+        if not filename:
+            self._client._raiseError("indexFilenameNotSpecified")
+
+        with open(filename, "r", encoding="utf-8") as file:
+            documents = json.load(file)
+
+        self._objects, self._documents, self._postings, self._deletes, self._sortedTokens = dict(), dict(), dict(), dict(), None
+
+        for key, document in documents.items():
+            self._indexDocument(key, document)
+
+        self.filename = filename
\ No newline at end of file
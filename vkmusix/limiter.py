@@ -0,0 +1,98 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Union
+import asyncio
+import heapq
+import itertools
+import time
+
+from vkmusix.enums import Priority
+
+class TokenBucket:
+    def __init__(self, rate: Union[float, None] = None, capacity: Union[float, None] = None) -> None:
+        self.rate = None
+        self.capacity = None
+
+        self._tokens = 0
+        self._updatedAt = time.monotonic()
+
+        self._waiters = list()
+        self._counter = itertools.count()
+
+        self.setRate(rate, capacity)
+
+
+    def setRate(self, rate: Union[float, None], capacity: Union[float, None] = None) -> None:
+        self._refill()
+
+        self.rate = rate if rate and rate > 0 else None
+        self.capacity = (capacity or self.rate) if self.rate else None
+        self._tokens = self.capacity if self.capacity and self._tokens > self.capacity else self._tokens
+
+        self._wakeUp()
+
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+
+        if self.rate:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updatedAt) * self.rate)
+
+        self._updatedAt = now
+
+
+    def _wakeUp(self) -> None:
+        if not self._waiters:
+            return
+
+        future = self._waiters[0][2]
+        if not future.done():
+            future.set_result(None)
+
+
+    async def acquire(self, amount: float, priority: Priority = Priority.Normal) -> None:
+        if not self.rate or amount <= 0:
+            return
+
+        loop = asyncio.get_event_loop()
+
+        waiter = [list(Priority).index(priority if isinstance(priority, Priority) else Priority.Normal), next(self._counter), loop.create_future()]
+        heapq.heappush(self._waiters, waiter)
+
+        try:
+            while self.rate:
+                if self._waiters[0] is not waiter:
+                    waiter[2] = loop.create_future()
+                    await waiter[2]
+                    continue
+
+                self._refill()
+
+                needed = min(amount, self.capacity)
+
+                if self._tokens >= needed:
+                    self._tokens -= amount
+                    return
+
+                await asyncio.sleep(min((needed - self._tokens) / self.rate, .25))
+
+        finally:
+            self._waiters.remove(waiter)
+            heapq.heapify(self._waiters)
+            self._wakeUp()
\ No newline at end of file
@@ -18,7 +18,9 @@
 
 from .getArtist import GetArtist
 from .getArtistAlbums import GetArtistAlbums
+from .iterArtistAlbums import IterArtistAlbums
 from .getArtistTracks import GetArtistTracks
+from .iterArtistTracks import IterArtistTracks
 from .getRelatedArtists import GetRelatedArtists
 
 from .followArtist import FollowArtist
@@ -27,7 +29,9 @@ from .unfollowArtist import UnfollowArtist
 class Artists(
     GetArtist,
     GetArtistAlbums,
+    IterArtistAlbums,
     GetArtistTracks,
+    IterArtistTracks,
     GetRelatedArtists,
 
     FollowArtist,
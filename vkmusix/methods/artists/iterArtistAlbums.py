@@ -0,0 +1,51 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class IterArtistAlbums:
+    from vkmusix.paginator import Paginator
+
+    def iterArtistAlbums(self, artistId: int, limit: int = None, offset: int = None, pageSize: int = 100) -> Paginator:
+        """
+        Лениво получает альбомы артиста постранично.
+
+        `Пример использования`:
+
+        for album in client.iterArtistAlbums(
+            artistId=5696274288194638935,
+            limit=1000,
+        ):
+            print(album)
+
+        :param artistId: идентификатор артиста. (``int``)
+        :param limit: максимальное количество альбомов. По умолчанию без ограничения. (``int``, `optional`)
+        :param offset: сколько альбомов пропустить. (``int``, `optional`)
+        :param pageSize: количество альбомов, получаемых за один запрос. По умолчанию ``100``. (``int``, `optional`)
+        :return: итератор по альбомам артиста, поддерживающий ``for`` и ``async for`` (``Paginator``).
+        """
+
+        from vkmusix.paginator import Paginator
+
+        return Paginator.fromMethod(
+            self,
+            lambda count, offset: self.getArtistAlbums(artistId, count, offset),
+            limit,
+            pageSize,
+            offset,
+        )
+
+    iter_artist_albums = iterArtistAlbums
\ No newline at end of file
@@ -17,12 +17,14 @@
 #  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
 
 from .getCuratorTracks import GetCuratorTracks
+from .iterCuratorTracks import IterCuratorTracks
 
 from .followCurator import FollowCurator
 from .unfollowCurator import UnfollowCurator
 
 class Curators(
     GetCuratorTracks,
+    IterCuratorTracks,
 
     FollowCurator,
     UnfollowCurator,
@@ -0,0 +1,51 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class IterCuratorTracks:
+    from vkmusix.paginator import Paginator
+
+    def iterCuratorTracks(self, curatorId: int, limit: int = None, offset: int = None, pageSize: int = 100) -> Paginator:
+        """
+        Лениво получает треки куратора постранично.
+
+        `Пример использования`:
+
+        for track in client.iterCuratorTracks(
+            curatorId=28905875,
+            limit=1000,
+        ):
+            print(track)
+
+        :param curatorId: идентификатор куратора. (``int``)
+        :param limit: максимальное количество треков. По умолчанию без ограничения. (``int``, `optional`)
+        :param offset: сколько треков пропустить. (``int``, `optional`)
+        :param pageSize: количество треков, получаемых за один запрос. По умолчанию ``100``. (``int``, `optional`)
+        :return: итератор по трекам куратора, поддерживающий ``for`` и ``async for`` (``Paginator``).
+        """
+
+        from vkmusix.paginator import Paginator
+
+        return Paginator.fromMethod(
+            self,
+            lambda count, offset: self.getCuratorTracks(curatorId, count, offset),
+            limit,
+            pageSize,
+            offset,
+        )
+
+    iter_curator_tracks = iterCuratorTracks
\ No newline at end of file
@@ -18,14 +18,22 @@
 
 from .getTrackCount import GetTrackCount
 from .getTracks import GetTracks
+from ._getLibraryTracks import _GetLibraryTracks
 
 from .getSections import GetSections
 from .getSection import GetSection
+from .iterSection import IterSection
+from .crawlSections import CrawlSections
 
 from .reorder import Reorder
+from .reorderLibrary import ReorderLibrary
+from ._reorderTracks import _ReorderTracks
 
 from .getPlaylists import GetPlaylists
+from .iterPlaylists import IterPlaylists
 from .getAllPlaylists import GetAllPlaylists
+from .buildLibraryIndex import BuildLibraryIndex
+from ._filterPlaylists import _FilterPlaylists
 
 from .getBroadcast import GetBroadcast
 from .setBroadcast import SetBroadcast
@@ -39,14 +47,22 @@ from .unfollowOwner import UnfollowOwner
 class Owners(
     GetTrackCount,
     GetTracks,
+    _GetLibraryTracks,
 
     GetSections,
     GetSection,
+    IterSection,
+    CrawlSections,
 
     Reorder,
+    ReorderLibrary,
+    _ReorderTracks,
 
     GetPlaylists,
+    IterPlaylists,
     GetAllPlaylists,
+    BuildLibraryIndex,
+    _FilterPlaylists,
 
     GetBroadcast,
     SetBroadcast,
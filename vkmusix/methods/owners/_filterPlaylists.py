@@ -0,0 +1,42 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class _FilterPlaylists:
+    from typing import Union, List
+
+    from vkmusix.types import Album, Playlist
+    from vkmusix.enums import PlaylistType
+
+    @staticmethod
+    def _filterPlaylists(playlists: Union[List[Union[Playlist, Album]], Playlist, Album, None], playlistTypes: Union[List[PlaylistType], PlaylistType, None]) -> List[Union[Playlist, Album]]:
+        from vkmusix.types import Album, Playlist
+        from vkmusix.enums import PlaylistType
+
+        if not playlists:
+            return list()
+
+        if not isinstance(playlists, list):
+            playlists = [playlists]
+
+        if not playlistTypes:
+            return playlists
+
+        if not isinstance(playlistTypes, list):
+            playlistTypes = [playlistTypes]
+
+        return [playlist for playlist in playlists if (isinstance(playlist, Playlist) and (PlaylistType.Own if playlist.own else PlaylistType.Foreign) in playlistTypes) or (isinstance(playlist, Album) and PlaylistType.Album in playlistTypes)]
\ No newline at end of file
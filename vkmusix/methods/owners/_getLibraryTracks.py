@@ -0,0 +1,42 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class _GetLibraryTracks:
+    from typing import Union, List
+
+    from vkmusix.types import Track
+
+    async def _getLibraryTracks(self, ownerId: int = None, hydrate: bool = True) -> Union[List[Track], None]:
+        if not ownerId:
+            ownerId = await self._getMyId()
+
+        sections = await self.getSections(
+            ownerId,
+        )
+
+        if not sections:
+            return
+
+        section = await sections[0].get()
+        subsections = section.subsections if section else None
+
+        if not subsections:
+            return
+
+        # Треки, которые не удалось заполнить, остаются заготовками: они есть в музыке, и вызывающий код должен их видеть
+        return await subsections[0].getTracks(hydrate) or None
\ No newline at end of file
@@ -0,0 +1,39 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class _ReorderTracks:
+    from typing import List
+
+    async def _reorderTracks(self, ownerId: int, currentTrackIds: List[int], desiredTrackIds: List[int], concurrency: int = 4) -> bool:
+        from vkmusix.utils import gatherWithConcurrency, planReorder
+
+        async def moveChain(chain: list) -> bool:
+            success = True
+
+            for trackId, beforeTrackId, afterTrackId in chain:
+                result = await self.reorder(trackId, beforeTrackId, afterTrackId, ownerId)
+                success = success and result
+
+            return success
+
+        results = await gatherWithConcurrency(
+            (moveChain(chain) for chain in planReorder(currentTrackIds, desiredTrackIds)),
+            concurrency,
+        )
+
+        return all(results)
\ No newline at end of file
@@ -0,0 +1,70 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class BuildLibraryIndex:
+    from vkmusix.aio import async_
+    from vkmusix.index import LibraryIndex
+
+    @async_
+    async def buildLibraryIndex(self, ownerId: int = None, filename: str = None, includePlaylists: bool = True) -> LibraryIndex:
+        """
+        Получает музыку и плейлисты owner'а (пользователь или группа) и строит по ним локальный полнотекстовый индекс, поиск по которому не требует обращений к ВКонтакте. Если файл ``filename`` уже существует, индекс загружается из него и дополняется.
+
+        `Пример использования`:
+
+        index = client.buildLibraryIndex(
+            filename="library.json",
+        )
+
+        print(index.search("artist:маленький lari"))
+
+        :param ownerId: идентификатор owner'а (пользователь или группа). По умолчанию залогиненный пользователь. (``int``, `optional`)
+        :param filename: путь к JSON-файлу, в который необходимо сохранить индекс. (``str``, `optional`)
+        :param includePlaylists: флаг, указывающий, необходимо ли также добавить в индекс плейлисты и альбомы. По умолчанию ``True``. (``bool``, `optional`)
+        :return: индекс (``LibraryIndex``).
+        """
+
+        from vkmusix.index import LibraryIndex
+        from vkmusix.utils import gatherWithConcurrency
+
+        if not ownerId:
+            ownerId = await self._getMyId()
+
+        async def getPlaylists() -> list:
+            if not includePlaylists:
+                return list()
+
+            return await self.getAllPlaylists(ownerId) or list()
+
+        tracks, playlists = await gatherWithConcurrency(
+            (
+                self._getLibraryTracks(ownerId),
+                getPlaylists(),
+            ),
+        )
+
+        index = LibraryIndex(self, filename)
+        index.add(tracks or list())
+        index.add(playlists)
+
+        if filename:
+            index.save()
+
+        return index
+
+    build_library_index = buildLibraryIndex
\ No newline at end of file
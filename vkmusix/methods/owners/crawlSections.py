@@ -0,0 +1,46 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class CrawlSections:
+    from vkmusix.crawler import SectionCrawler
+
+    def crawlSections(self, ownerId: int = None, depth: int = 2, maxItems: int = None, concurrency: int = 4, hydrate: bool = False) -> SectionCrawler:
+        """
+        Лениво обходит все разделы музыки owner'а (пользователь или группа): разделы, их подразделы и следующие части (``nextOffset``) запрашиваются одновременно. Треки и плейлисты, встречающиеся в нескольких разделах, выдаются один раз, в порядке получения разделов.
+
+        `Пример использования`:
+
+        for item in client.crawlSections(
+            ownerId=-1,
+            maxItems=500,
+        ):
+            print(item)
+
+        :param ownerId: идентификатор owner'а (пользователь или группа). По умолчанию залогиненный пользователь. (``int``, `optional`)
+        :param depth: максимальная глубина вложенности запрашиваемых подразделов. ``0`` — только сами разделы. По умолчанию ``2``. (``int``, `optional`)
+        :param maxItems: максимальное количество треков и плейлистов. По умолчанию без ограничения. (``int``, `optional`)
+        :param concurrency: максимальное количество одновременных запросов. По умолчанию ``4``. (``int``, `optional`)
+        :param hydrate: флаг, указывающий, необходимо ли дополнить полной информацией треки, для которых ВКонтакте вернул только идентификаторы, через ``client.hydrate()``. По умолчанию ``False``. (``bool``, `optional`)
+        :return: итератор по трекам и плейлистам (``types.Track``, ``types.Playlist``), поддерживающий ``for`` и ``async for`` (``SectionCrawler``).
+        """
+
+        from vkmusix.crawler import SectionCrawler
+
+        return SectionCrawler(self, ownerId, depth, maxItems, concurrency, hydrate)
+
+    crawl_sections = crawlSections
\ No newline at end of file
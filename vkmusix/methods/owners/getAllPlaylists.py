@@ -24,9 +24,9 @@ class GetAllPlaylists:
     from vkmusix.enums import PlaylistType
 
     @async_
-    async def getAllPlaylists(self, ownerId: int = None, playlistTypes: Union[List[PlaylistType], PlaylistType] = None) -> Union[List[Union[Playlist, Album]], None]:
+    async def getAllPlaylists(self, ownerId: int = None, playlistTypes: Union[List[PlaylistType], PlaylistType] = None, concurrency: int = 4) -> Union[List[Union[Playlist, Album]], None]:
         """
-        Получает все плейлисты и (или) альбомы owner'а (пользователь или группа).
+        Получает все плейлисты и (или) альбомы owner'а (пользователь или группа). Для постепенного получения используйте ``client.iterPlaylists()``.
 
         `Пример использования`:
 
@@ -38,61 +38,48 @@ class GetAllPlaylists:
 
         :param ownerId: идентификатор owner'а (пользователь или группа). По умолчанию залогиненный пользователь. (``int``, `optional`)
         :param playlistTypes: нужные типы плейлистов. (``Union[list[enums.PlaylistType], enums.PlaylistType]``, `optional`)
+        :param concurrency: максимальное количество одновременных запросов. По умолчанию ``4``. (``int``, `optional`)
         :return: `При успехе`: плейлисты и (или) альбомы (`list[Union[types.Playlist, types.Album]]). `Если owner (пользователь или группа) не найден или плейлисты и (или) альбомы отсутствуют`: ``None``.
         """
 
-        from asyncio import gather
-
-        from vkmusix.types import Album, Playlist
-        from vkmusix.enums import PlaylistType
+        from vkmusix.types import Playlist
+        from vkmusix.utils import gatherWithConcurrency
 
         if not ownerId:
             ownerId = await self._getMyId()
 
-        playlistsPerReq = 10
-
-        method = "getPlaylists"
-        params = {
-            "owner_id": ownerId,
-            "count": playlistsPerReq,
-        }
-        playlists_ = await self._req(method, params)
-
-        playlists = [playlist for playlist in playlists_.get("items")]
-        count = playlists_.get("count")
-        offset = count if count < playlistsPerReq else playlistsPerReq
-
-        if offset < count:
-            tasks = list()
-            while offset < count:
-                tasks.append(
-                    self._req(
-                        method,
-                        {
-                            **params,
-                            **{
-                                "offset": offset,
-                            },
-                        },
-                    )
-                )
-                offset += playlistsPerReq
-
-            playlists_ = await gather(*tasks)
-            for playlistGroup in playlists_:
-                for playlist in playlistGroup.get("items"):
-                    playlists.append(playlist)
-
-        playlists = self._finalizeResponse(playlists, Playlist)
-
-        if not isinstance(playlists, list):
-            playlists = [playlists]
-
-        if playlistTypes:
-            if not isinstance(playlistTypes, list):
-                playlistTypes = [playlistTypes]
-
-            playlists = [playlist for playlist in playlists if (isinstance(playlist, Playlist) and (PlaylistType.Own if playlist.own else PlaylistType.Foreign) in playlistTypes) or (isinstance(playlist, Album) and PlaylistType.Album in playlistTypes)]
+        playlistsPerReq = 100
+
+        async def getPage(offset: int) -> tuple:
+            playlists_ = await self._req(
+                "getPlaylists",
+                {
+                    "owner_id": ownerId,
+                    "count": playlistsPerReq,
+                    "offset": offset,
+                },
+            )
+
+            if not playlists_:
+                return list(), 0
+
+            playlists = self._finalizeResponse(playlists_.get("items"), Playlist)
+
+            self._rememberPlaylists(playlists)
+
+            playlists = self._filterPlaylists(playlists, playlistTypes)
+
+            return playlists, playlists_.get("count") or 0
+
+        playlists, count = await getPage(0)
+
+        pages = await gatherWithConcurrency(
+            (getPage(offset) for offset in range(playlistsPerReq, count, playlistsPerReq)),
+            concurrency,
+        )
+
+        for pagePlaylists, _ in pages:
+            playlists.extend(pagePlaylists)
 
         return playlists if playlists else None
 
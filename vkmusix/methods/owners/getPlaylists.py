@@ -44,8 +44,7 @@ class GetPlaylists:
         :return: `При успехе`: плейлисты и (или) альбомы (`list[Union[types.Playlist, types.Album]]). `Если owner (пользователь или группа) не найден или плейлисты и (или) альбомы отсутствуют`: ``None``.
         """
 
-        from vkmusix.types import Album, Playlist
-        from vkmusix.enums import PlaylistType
+        from vkmusix.types import Playlist
 
         if not ownerId:
             ownerId = await self._getMyId()
@@ -67,11 +66,9 @@ class GetPlaylists:
             Playlist,
         )
 
-        if playlistTypes:
-            if not isinstance(playlistTypes, list):
-                playlistTypes = [playlistTypes]
+        self._rememberPlaylists(playlists)
 
-            playlists = [playlist for playlist in playlists if (isinstance(playlist, Playlist) and (PlaylistType.Own if playlist.own else PlaylistType.Foreign) in playlistTypes) or (isinstance(playlist, Album) and PlaylistType.Album in playlistTypes)]
+        playlists = self._filterPlaylists(playlists, playlistTypes)
 
         return playlists if playlists else None
 
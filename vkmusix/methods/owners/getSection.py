@@ -23,7 +23,7 @@ class GetSection:
     from vkmusix.types import Section
 
     @async_
-    async def getSection(self, sectionId: str, offset: str = None) -> Union[Section, None]:
+    async def getSection(self, sectionId: str, offset: str = None, hydrate: bool = False) -> Union[Section, None]:
         """
         Получает треки из раздела музыки.
 
@@ -37,6 +37,7 @@ class GetSection:
 
         :param sectionId: идентификатор раздела музыки. (``str``)
         :param offset: уникальное значение, содержащееся в атрибуте ``nextOffset`` объекта класса ``types.Section``. Необходимо для получения следующих результатов в разделе. (``str``, `optional`)
+        :param hydrate: флаг, указывающий, необходимо ли сразу получить полную информацию о треках раздела, если ВКонтакте вернул только их идентификаторы, через ``client.hydrate()``. По умолчанию ``False``. (``bool``, `optional`)
         :return: `При успехе`: информация о разделе музыки (``types.Section``). `Если раздел не найден`: ``None``.
         """
 
@@ -55,6 +56,11 @@ class GetSection:
         if not section:
             return
 
-        return self._finalizeResponse(section, Section)
+        section = self._finalizeResponse(section, Section)
+
+        if hydrate and section.tracks:
+            await self.hydrate(section.tracks)
+
+        return section
 
     get_section = getSection
\ No newline at end of file
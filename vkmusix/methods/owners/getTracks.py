@@ -23,7 +23,7 @@ class GetTracks:
     from vkmusix.types import Track
 
     @async_
-    async def getTracks(self, sectionId: str) -> Union[List[Track], None]:
+    async def getTracks(self, sectionId: str, hydrate: bool = False) -> Union[List[Track], None]:
         """
         Получает треки из раздела музыки.
 
@@ -36,6 +36,7 @@ class GetTracks:
         print(tracks)
 
         :param sectionId: идентификатор раздела музыки. (``str``)
+        :param hydrate: флаг, указывающий, необходимо ли сразу получить полную информацию о треках через ``client.hydrate()``. Иначе у треков известны только идентификаторы. По умолчанию ``False``. (``bool``, `optional`)
         :return: `При успехе`: треки (``list[types.Track]``). `Если раздел не найден или треки отсутствуют`: ``None``.
         """
 
@@ -47,7 +48,7 @@ class GetTracks:
             },
         )).get("audios")
 
-        tracks = await self._parseAPITracks(tracks)
+        tracks = await self._parseAPITracks(tracks, hydrate)
 
         return tracks
 
@@ -23,7 +23,7 @@ class GetTracksFromWall:
     from vkmusix.types import Track
 
     @async_
-    async def getTracksFromWall(self, ownerId: int = None) -> Union[List[Track], None]:
+    async def getTracksFromWall(self, ownerId: int = None, hydrate: bool = False) -> Union[List[Track], None]:
         """
         Получает треки со стены owner'а (пользователь или группа).
 
@@ -36,6 +36,7 @@ class GetTracksFromWall:
         print(tracks)
 
         :param ownerId: идентификатор owner'а (пользователь или группа). По умолчанию залогиненный пользователь. (``int``, `optional`)
+        :param hydrate: флаг, указывающий, необходимо ли сразу получить полную информацию о треках через ``client.hydrate()``. Иначе у треков известны только идентификаторы. По умолчанию ``False``. (``bool``, `optional`)
         :return: `При успехе`: треки (``list[types.Track]``). `Если owner (пользователь или группа) не найден или треки отсутствуют`: ``None``.
         """
 
@@ -51,7 +52,7 @@ class GetTracksFromWall:
             },
         )).get("audios")
 
-        tracks = await self._parseAPITracks(tracks)
+        tracks = await self._parseAPITracks(tracks, hydrate)
 
         return tracks
 
@@ -0,0 +1,55 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class IterPlaylists:
+    from typing import Union, List
+
+    from vkmusix.paginator import Paginator
+    from vkmusix.enums import PlaylistType
+
+    def iterPlaylists(self, ownerId: int = None, limit: int = None, offset: int = None, playlistTypes: Union[List[PlaylistType], PlaylistType] = None, pageSize: int = 100) -> Paginator:
+        """
+        Лениво получает плейлисты и (или) альбомы owner'а (пользователь или группа) постранично.
+
+        `Пример использования`:
+
+        for playlist in client.iterPlaylists(
+            ownerId=-1,
+        ):
+            print(playlist)
+
+        :param ownerId: идентификатор owner'а (пользователь или группа). По умолчанию залогиненный пользователь. (``int``, `optional`)
+        :param limit: максимальное количество плейлистов и (или) альбомов. По умолчанию без ограничения. (``int``, `optional`)
+        :param offset: сколько плейлистов и (или) альбомов пропустить. (``int``, `optional`)
+        :param playlistTypes: нужные типы плейлистов. (``Union[list[enums.PlaylistType], enums.PlaylistType]``, `optional`)
+        :param pageSize: количество плейлистов и (или) альбомов, получаемых за один запрос. По умолчанию ``100``. (``int``, `optional`)
+        :return: итератор по плейлистам и (или) альбомам, поддерживающий ``for`` и ``async for`` (``Paginator``).
+        """
+
+        from vkmusix.paginator import Paginator
+
+        return Paginator.fromMethod(
+            self,
+            lambda count, offset: self.getPlaylists(ownerId, count, offset),
+            limit,
+            pageSize,
+            offset,
+            lambda playlists: self._filterPlaylists(playlists, playlistTypes),
+        )
+
+    iter_playlists = iterPlaylists
\ No newline at end of file
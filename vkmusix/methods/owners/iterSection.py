@@ -0,0 +1,51 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class IterSection:
+    from vkmusix.paginator import Paginator
+
+    def iterSection(self, sectionId: str, limit: int = None, offset: str = None) -> Paginator:
+        """
+        Лениво получает треки из раздела музыки, переходя по ``nextOffset``.
+
+        `Пример использования`:
+
+        for track in client.iterSection(
+            sectionId="PUlQVA8GR0R3W0tMF1kSOSceDR9aRzQEKgQKHRcYSV5kUUREDQ1bU35cXFoXAFtEfEZYWhcBSVxkDAwYUEYKCmRHS0IXDlpKZFpcVA8FR0R0XUtMGAZTX3ZeUUEASQ",
+        ):
+            print(track)
+
+        :param sectionId: идентификатор раздела музыки. (``str``)
+        :param limit: максимальное количество треков. По умолчанию без ограничения. (``int``, `optional`)
+        :param offset: уникальное значение, содержащееся в атрибуте ``nextOffset`` объекта класса ``types.Section``, с которого необходимо начать. (``str``, `optional`)
+        :return: итератор по трекам раздела, поддерживающий ``for`` и ``async for`` (``Paginator``).
+        """
+
+        from vkmusix.paginator import Paginator
+
+        async def fetchPage(offset: str, count: int) -> tuple:
+            section = await self.getSection(sectionId, offset)
+
+            if not section:
+                return None, None
+
+            return section.tracks, section.nextOffset if section.nextOffset != offset else None
+
+        return Paginator(self, fetchPage, limit, offset=offset)
+
+    iter_section = iterSection
\ No newline at end of file
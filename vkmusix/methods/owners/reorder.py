@@ -20,9 +20,9 @@ class Reorder:
     from vkmusix.aio import async_
 
     @async_
-    async def reorder(self, trackId: int, beforeTrackId: int = None, afterTrackId: int = None) -> bool:
+    async def reorder(self, trackId: int, beforeTrackId: int = None, afterTrackId: int = None, ownerId: int = None) -> bool:
         """
-        Изменяет порядок трека в музыке пользователя. Должен быть заполнен один из параметров на выбор: ``beforeTrackId`` или ``afterTrackId``.
+        Изменяет порядок трека в музыке пользователя или группы. Должен быть заполнен один из параметров на выбор: ``beforeTrackId`` или ``afterTrackId``.
 
         `Пример использования для перемещения на место перед определённым треком`:
 
@@ -42,6 +42,10 @@ class Reorder:
 
         print(result)
 
+        :param trackId: идентификатор трека. (``int``)
+        :param beforeTrackId: идентификатор трека, перед которым необходимо поместить трек. (``int``, `optional`)
+        :param afterTrackId: идентификатор трека, после которого необходимо поместить трек. (``int``, `optional`)
+        :param ownerId: идентификатор owner'а (пользователь или группа), в музыке которого находится трек. По умолчанию залогиненный пользователь. (``int``, `optional`)
         :return: ``True``.
         """
 
@@ -55,6 +59,7 @@ class Reorder:
             "reorder",
             {
                 "audio_id": trackId,
+                "owner_id": ownerId,
                 **(
                     {
                         "before": beforeTrackId,
@@ -0,0 +1,62 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class ReorderLibrary:
+    from typing import List
+
+    from vkmusix.aio import async_
+
+    @async_
+    async def reorderLibrary(self, trackIds: List[int], ownerId: int = None, concurrency: int = 4) -> bool:
+        """
+        Расставляет треки в музыке пользователя или группы в указанном порядке. Перемещаются только треки, не входящие в наибольшую уже упорядоченную подпоследовательность, поэтому количество вызовов ``client.reorder()`` минимально. Треки, не указанные в ``trackIds``, остаются на своих местах относительно друг друга.
+
+        `Пример использования`:
+
+        result = client.reorderLibrary(
+            trackIds=[456239019, 456239017, 456239018],
+        )
+
+        print(result)
+
+        :param trackIds: идентификаторы треков в нужном порядке (сверху вниз). (``list[int]``)
+        :param ownerId: идентификатор владельца музыки (пользователь или группа). По умолчанию залогиненный пользователь. (``int``, `optional`)
+        :param concurrency: максимальное количество одновременно выполняемых независимых цепочек перемещений. Перемещения внутри цепочки выполняются последовательно. По умолчанию ``4``. (``int``, `optional`)
+        :return: `При успехе`: ``True``. `Если музыка не найдена или часть треков не удалось переместить`: ``False``.
+        """
+
+        if not ownerId:
+            ownerId = await self._getMyId()
+
+        tracks = await self._getLibraryTracks(
+            ownerId,
+            False,
+        )
+
+        if not tracks:
+            return False
+
+        return await self._reorderTracks(
+            ownerId,
+            # trackId чужих треков, добавленных в музыку, относятся к другому владельцу и могут совпасть с trackId треков владельца
+            [track.trackId for track in tracks if track.ownerId == ownerId],
+            list(dict.fromkeys(trackIds)),
+            concurrency,
+        )
+
+    reorder_library = reorderLibrary
\ No newline at end of file
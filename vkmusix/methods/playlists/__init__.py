@@ -25,7 +25,11 @@ from .addPlaylist import AddPlaylist
 from .removePlaylist import RemovePlaylist
 from .editPlaylist import EditPlaylist
 from .copyPlaylist import CopyPlaylist
+from .copyPlaylists import CopyPlaylists
+from .syncPlaylist import SyncPlaylist
 from ._editPlaylistPhoto import _EditPlaylistPhoto
+from ._reorderPlaylist import _ReorderPlaylist
+from ._playlistMetadata import _PlaylistMetadata
 
 class Playlists(
     GetPlaylist,
@@ -37,6 +41,10 @@ class Playlists(
     CreatePlaylist,
     EditPlaylist,
     CopyPlaylist,
+    CopyPlaylists,
+    SyncPlaylist,
     _EditPlaylistPhoto,
+    _ReorderPlaylist,
+    _PlaylistMetadata,
 ):
     pass
\ No newline at end of file
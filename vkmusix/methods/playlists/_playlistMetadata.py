@@ -0,0 +1,52 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class _PlaylistMetadata:
+    from typing import Union, List
+
+    from vkmusix.types import Album, Playlist
+
+    playlistCacheSize = 1024
+
+    def _rememberPlaylists(self, playlists: Union[List[Union[Playlist, Album]], Playlist, Album, None]) -> None:
+        if not playlists:
+            return
+
+        if not isinstance(playlists, list):
+            playlists = [playlists]
+
+        for playlist in playlists:
+            ownerId = getattr(playlist, "ownerId", None)
+            playlistId = getattr(playlist, "playlistId", None)
+            trackCount = getattr(playlist, "trackCount", None)
+
+            if ownerId and playlistId and trackCount is not None:
+                self._rememberTrackCount(ownerId, playlistId, trackCount)
+
+    def _rememberTrackCount(self, ownerId: int, playlistId: int, trackCount: int) -> None:
+        cache = self._playlistTrackCounts
+
+        key = (int(ownerId), int(playlistId))
+        cache[key] = trackCount
+        cache.move_to_end(key)
+
+        while len(cache) > self.playlistCacheSize:
+            cache.popitem(last=False)
+
+    def _getCachedTrackCount(self, ownerId: int, playlistId: int) -> Union[int, None]:
+        return self._playlistTrackCounts.get((int(ownerId), int(playlistId)))
\ No newline at end of file
@@ -0,0 +1,67 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class _ReorderPlaylist:
+    from typing import List
+
+    async def _reorderPlaylist(self, playlistId: int, ownerId: int, desiredIds: List[str], currentIds: List[str] = None) -> bool:
+        import json
+
+        from vkmusix import web
+        from vkmusix.errors import AccessDenied
+        from vkmusix.utils import chunks, planReorder
+
+        if currentIds is None:
+            tracks = await self.getPlaylistTracks(
+                playlistId,
+                ownerId,
+                True,
+            )
+
+            currentIds = [f"{track.ownerId}_{track.trackId}" for track in tracks or list()]
+
+        reorderActions = [
+            [id, beforeId or str(), afterId or str()]
+            for chain in planReorder(currentIds, desiredIds)
+            for id, beforeId, afterId in chain
+        ]
+
+        success = True
+
+        # Перемещения отправляются по порядку: внутри цепочки каждое следующее опирается на предыдущее
+        for reorderActionsChunk in chunks(reorderActions, 500):
+            try:
+                response = await self._req(
+                    "editPlaylist",
+                    {
+                        "owner_id": ownerId,
+                        "playlist_id": playlistId,
+                    },
+                    data={
+                        "reorder_actions": json.dumps(reorderActionsChunk),
+                    },
+                    httpMethod=web.Method.POST,
+                )
+
+                # Необработанную ошибку _req возвращает словарём, поэтому успехом считается только ``1``
+                success = success and response in (1, True)
+
+            except AccessDenied:
+                return False
+
+        return success
\ No newline at end of file
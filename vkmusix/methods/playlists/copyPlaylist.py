@@ -23,7 +23,7 @@ class CopyPlaylist:
     from vkmusix.types import Playlist
 
     @async_
-    async def copyPlaylist(self, playlistId: int, ownerId: int = None, groupId: int = None, chatId: int = None, title: Union[str, None] = str(), description: Union[str, None] = str(), photo: Union[str, None] = str()) -> Union[Playlist, None]:
+    async def copyPlaylist(self, playlistId: int, ownerId: int = None, groupId: int = None, chatId: int = None, title: Union[str, None] = str(), description: Union[str, None] = str(), photo: Union[str, None] = str(), concurrency: int = 1, progress: callable = None) -> Union[Playlist, None]:
         """
         Копирует плейлист или альбом в музыку пользователя или группы.
 
@@ -43,44 +43,93 @@ class CopyPlaylist:
         :param title: название плейлиста. ``None`` для удаления. (``Union[str, None]``, `optional`)
         :param description: описание плейлиста. ``None`` для удаления. (``Union[str, None]``, `optional`)
         :param photo: ссылка на фото плейлиста. ``None`` для удаления. Не для удаления не работает. (``Union[str, None]``, `optional`)
-        :return: `При успехе`: информация о скопированном плейлисте или альбоме (``Union[types.Playlist, types.Album]``). `Если плейлист или альбом не найден`: ``None``.
+        :param concurrency: максимальное количество одновременно отправляемых частей по 50 треков. По умолчанию ``1``: части отправляются последовательно, и порядок треков совпадает с оригиналом. При значении больше ``1`` после добавления порядок восстанавливается перемещением треков и проверяется повторным чтением плейлиста. (``int``, `optional`)
+        :param progress: функция, вызываемая после добавления каждой части треков с аргументами ``(added, total)`` — количество обработанных треков и их общее количество. Может быть асинхронной. (``callable``, `optional`)
+        :return: `При успехе`: информация о скопированном плейлисте или альбоме (``Union[types.Playlist, types.Album]``). `Если плейлист или альбом не найден или после параллельного добавления не удалось восстановить порядок треков (копия при этом остаётся)`: ``None``.
         """
 
         from datetime import datetime
+        from typing import Union
+
+        from vkmusix.types import Playlist
+        from vkmusix.utils import gatherWithConcurrency
 
         if not ownerId:
             ownerId = await self._getMyId()
 
-        playlist = await self.getPlaylist(playlistId, ownerId)
+        async def createCopy() -> Union[Playlist, None]:
+            playlist = await self.getPlaylist(playlistId, ownerId)
+
+            if not playlist:
+                return
+
+            title_ = playlist.title
+            description_ = playlist.description
+            photo_ = playlist.photo
 
-        title_ = playlist.title
-        description_ = playlist.description
-        photo_ = playlist.photo
+            if title != str():
+                title_ = title if title is not None else datetime.utcnow().strftime("%d.%m.%Y / %H:%M:%S")
 
-        if title != str():
-            title_ = title if title is not None else datetime.utcnow().strftime("%d.%m.%Y / %H:%M:%S")
+            if description != str():
+                description_ = description
 
-        if description != str():
-            description_ = description
+            if photo != str():
+                photo_ = None if True else photo
 
-        if photo != str():
-            photo_ = None if True else photo
+            elif photo_:
+                _, photo_ = photo_.popitem()
 
-        elif photo_:
-            _, photo_ = photo_.popitem()
+            return await self.createPlaylist(
+                title_,
+                description_,
+                photo_,
+                groupId,
+                chatId,
+            )
 
-        newPlaylist = await self.createPlaylist(
-            title_,
-            description_,
-            photo_,
-            groupId,
-            chatId,
+        newPlaylist, tracks = await gatherWithConcurrency(
+            (
+                createCopy(),
+                self.getPlaylistTracks(playlistId, ownerId, True),
+            ),
         )
 
-        tracks = await playlist.getTracks(True)
+        if not newPlaylist:
+            return
+
         if tracks:
             ownerIds, trackIds = zip(*[(track.ownerId, track.trackId) for track in tracks[::-1]])
-            await newPlaylist.addTracks(list(ownerIds), list(trackIds))
+
+            await self.add(
+                list(ownerIds),
+                list(trackIds),
+                newPlaylist.playlistId,
+                newPlaylist.ownerId,
+                concurrency,
+                progress=progress,
+            )
+
+            if concurrency != 1 and len(tracks) > 50:
+                desiredIds = [f"{track.ownerId}_{track.trackId}" for track in tracks]
+
+                await self._reorderPlaylist(
+                    newPlaylist.playlistId,
+                    newPlaylist.ownerId,
+                    desiredIds,
+                )
+
+                newTracks = await self.getPlaylistTracks(
+                    newPlaylist.playlistId,
+                    newPlaylist.ownerId,
+                    True,
+                )
+
+                newIds = [f"{track.ownerId}_{track.trackId}" for track in newTracks or list()]
+                newIdsSet = set(newIds)
+
+                # Треки, которые не удалось добавить, не считаются нарушением порядка
+                if newIds != [id for id in desiredIds if id in newIdsSet]:
+                    return
 
         return newPlaylist
 
@@ -0,0 +1,90 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class CopyPlaylists:
+    from typing import Union, List
+
+    from vkmusix.aio import async_
+    from vkmusix.types import Playlist
+
+    @async_
+    async def copyPlaylists(self, playlistIds: List[int], ownerIds: Union[List[int], int] = None, groupId: int = None, concurrency: int = 2, chunksConcurrency: int = 1, progress: callable = None) -> List[Union[Playlist, None]]:
+        """
+        Копирует несколько плейлистов или альбомов в музыку пользователя или группы одновременно.
+
+        `Пример использования`:
+
+        playlists = client.copyPlaylists(
+            playlistIds=[19201020, 19201021],
+            ownerIds=-2000201020,
+        )
+
+        print(playlists)
+
+        :param playlistIds: идентификаторы плейлистов или альбомов. (``list[int]``)
+        :param ownerIds: идентификаторы владельцев плейлистов или альбомов (пользователи или группы) — один на все плейлисты или по одному на каждый. (``Union[list[int], int]``, `optional`)
+        :param groupId: идентификатор группы, в которую необходимо скопировать плейлисты или альбомы. (``int``, `optional`)
+        :param concurrency: максимальное количество одновременно копируемых плейлистов. По умолчанию ``2``. (``int``, `optional`)
+        :param chunksConcurrency: максимальное количество одновременно отправляемых частей треков внутри одного плейлиста. По умолчанию ``1``, подробнее — в ``client.copyPlaylist()``. (``int``, `optional`)
+        :param progress: функция, вызываемая после копирования каждого плейлиста с аргументами ``(copied, total)`` — количество обработанных плейлистов и их общее количество. Может быть асинхронной. (``callable``, `optional`)
+        :return: скопированные плейлисты в порядке ``playlistIds`` (``list[Union[types.Playlist, None]]``). `Если плейлист не найден или его не удалось скопировать`: ``None`` на его месте.
+        """
+
+        from inspect import isawaitable
+        from typing import Union
+
+        from vkmusix.errors import Error
+        from vkmusix.types import Playlist
+        from vkmusix.utils import gatherWithConcurrency
+
+        if not isinstance(ownerIds, list):
+            ownerIds = [ownerIds] * len(playlistIds)
+
+        elif len(ownerIds) != len(playlistIds):
+            self._raiseError("ownerIdsAndPlaylistIdsLenDifferent")
+
+        copiedCount = [0]
+
+        async def copyOne(playlistId: int, ownerId: int) -> Union[Playlist, None]:
+            try:
+                playlist = await self.copyPlaylist(
+                    playlistId,
+                    ownerId,
+                    groupId,
+                    concurrency=chunksConcurrency,
+                )
+
+            except Error:
+                playlist = None
+
+            copiedCount[0] += 1
+
+            if progress:
+                result = progress(copiedCount[0], len(playlistIds))
+
+                if isawaitable(result):
+                    await result
+
+            return playlist
+
+        return await gatherWithConcurrency(
+            (copyOne(playlistId, ownerId) for playlistId, ownerId in zip(playlistIds, ownerIds)),
+            concurrency,
+        )
+
+    copy_playlists = copyPlaylists
\ No newline at end of file
@@ -78,6 +78,10 @@ class GetPlaylist:
         if includeTracks:
             playlist["tracks"] = responses[1]
 
-        return self._finalizeResponse(playlist, Playlist)
+        playlist = self._finalizeResponse(playlist, Playlist)
+
+        self._rememberPlaylists(playlist)
+
+        return playlist
 
     get_playlist = getPlaylist
\ No newline at end of file
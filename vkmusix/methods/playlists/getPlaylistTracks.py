@@ -23,7 +23,7 @@ class GetPlaylistTracks:
     from vkmusix.types import Track
 
     @async_
-    async def getPlaylistTracks(self, playlistId: int, ownerId: int = None, isLarge: bool = False) -> Union[List[Track], None]:
+    async def getPlaylistTracks(self, playlistId: int, ownerId: int = None, isLarge: bool = False, hydrate: bool = False, hedge: bool = False) -> Union[List[Track], None]:
         """
         Получает треки плейлиста или альбома.
 
@@ -38,28 +38,25 @@ class GetPlaylistTracks:
 
         :param playlistId: идентификатор плейлиста или альбома. (``int``)
         :param ownerId: идентификатор владельца плейлиста или альбома (пользователь или группа). (``int``, `optional`)
-        :param isLarge: флаг, указывающий, содержит ли плейлист или альбом более 1000 треков. По умолчанию ``False``. Если ``True``, будет получена ограниченная информация о всех треках, если ``False`` — только последние 1000 треков, но с полной информацией. Установите ``None``, чтобы библиотека определила автоматически. Игнорируется для приватных плейлистов. (``bool``, `optional`)
+        :param isLarge: флаг, указывающий, содержит ли плейлист или альбом более 1000 треков. По умолчанию ``False``. Если ``True``, будет получена ограниченная информация о всех треках, если ``False`` — только последние 1000 треков, но с полной информацией. Установите ``None``, чтобы библиотека определила автоматически: по уже известному количеству треков (из ранее полученной информации о плейлисте), а если оно неизвестно — сначала через веб-версию, и только если в ней оказалось 1000 треков, через список идентификаторов. Игнорируется для приватных плейлистов. (``bool``, `optional`)
+        :param hydrate: флаг, указывающий, необходимо ли дополнить полной информацией треки, полученные с ограниченной информацией (при ``isLarge``), через ``client.hydrate()``. Треки, уже полученные через веб-версию, повторно не запрашиваются. По умолчанию ``False``. (``bool``, `optional`)
+        :param hedge: флаг, указывающий, необходимо ли при ``isLarge=None`` и неизвестном количестве треков запросить веб-версию и список идентификаторов одновременно. Ускоряет получение больших плейлистов ценой одного лишнего запроса для небольших. По умолчанию ``False``. (``bool``, `optional`)
         :return: `При успехе`: треки плейлиста или альбома (``list[types.Track]``). `Если плейлист или альбом не найден или треки отсутствуют`: ``None``.
         """
 
+        from typing import Union, List
+
         from vkmusix import web
         from vkmusix.config import VK, headers
+        from vkmusix.types import Track
+        from vkmusix.utils import gatherWithConcurrency
 
         if not ownerId:
             ownerId = await self._getMyId()
 
-        if isLarge is None:
-            playlist = await self.getPlaylist(
-                playlistId,
-                ownerId,
-            )
+        webTracksLimit = 1000
 
-            if not playlist:
-                return
-
-            isLarge = playlist.trackCount and playlist.trackCount > 1000
-
-        if not isLarge:
+        async def getWebTracks() -> Union[List[Track], None]:
             tracks = await self._client(
                 f"{VK}music/playlist/{ownerId}_{playlistId}",
                 headers=headers,
@@ -79,12 +76,9 @@ class GetPlaylistTracks:
                 )
                 statusCode = tracks.status_code
 
-            tracks = await self._parseWebTracks(tracks.text)
+            return await self._parseWebTracks(tracks.text)
 
-        else:
-            tracks = None
-
-        if not tracks:
+        async def getIdTracks() -> Union[List[Track], None]:
             tracks = (await self._req(
                 "getAudioIdsBySource",
                 {
@@ -93,7 +87,53 @@ class GetPlaylistTracks:
                 },
             )).get("audios")
 
-            tracks = await self._parseAPITracks(tracks)
+            self._rememberTrackCount(ownerId, playlistId, len(tracks or list()))
+
+            return await self._parseAPITracks(tracks)
+
+        if isLarge is None:
+            trackCount = self._getCachedTrackCount(ownerId, playlistId)
+
+            if trackCount is not None:
+                isLarge = trackCount >= webTracksLimit
+
+        webTracks = None
+
+        if isLarge is None and hedge:
+            webTracks, tracks = await gatherWithConcurrency(
+                (
+                    getWebTracks(),
+                    getIdTracks(),
+                ),
+            )
+
+            if webTracks and len(webTracks) >= len(tracks or list()):
+                return webTracks
+
+        elif not isLarge:
+            webTracks = await getWebTracks()
+
+            if webTracks and (isLarge is False or len(webTracks) < webTracksLimit):
+                if isLarge is None:
+                    self._rememberTrackCount(ownerId, playlistId, len(webTracks))
+
+                return webTracks
+
+            tracks = await getIdTracks()
+
+        else:
+            tracks = await getIdTracks()
+
+        if tracks and webTracks:
+            webTracks = {
+                track.id: track
+                for track in webTracks
+            }
+
+            tracks = [webTracks.get(track.id, track) for track in tracks]
+
+        if tracks and hydrate:
+            await self.hydrate(tracks)
 
         return tracks if tracks else None
 
@@ -20,7 +20,7 @@ class RemoveAllTracksFromPlaylist:
     from vkmusix.aio import async_
 
     @async_
-    async def removeAllTracksFromPlaylist(self, playlistId: int = None, groupId: int = None) -> bool:
+    async def removeAllTracksFromPlaylist(self, playlistId: int = None, groupId: int = None, concurrency: int = 4) -> bool:
         """
         Удаляет все треки из плейлиста пользователя или группы. Метод не работает для плейлистов, привязанных к чату.
 
@@ -34,12 +34,14 @@ class RemoveAllTracksFromPlaylist:
 
         :param playlistId: идентификатор плейлиста. (``int``, `optional`)
         :param groupId: идентификатор группы, из плейлиста которой необходимо удалить треки. (``int``, `optional`)
-        :return: `При успехе`: ``True``. `Если плейлист не найден, треки отсутствуют или их не удалось удалить`: ``False``.
+        :param concurrency: максимальное количество одновременно отправляемых частей по 100 треков. По умолчанию ``4``. (``int``, `optional`)
+        :return: `При успехе`: ``True``. `Если плейлист не найден, треки отсутствуют или хотя бы часть из них не удалось удалить`: ``False``.
         """
 
         tracks = await self.getPlaylistTracks(
             playlistId,
             groupId,
+            True,
         )
 
         if not tracks:
@@ -54,6 +56,7 @@ class RemoveAllTracksFromPlaylist:
             playlistId,
             groupId,
             False,
+            concurrency,
         )
 
-        return bool(result[0])
\ No newline at end of file
+        return all(result)
\ No newline at end of file
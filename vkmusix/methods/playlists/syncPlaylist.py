@@ -0,0 +1,130 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class SyncPlaylist:
+    from typing import List
+
+    from vkmusix.aio import async_
+
+    @async_
+    async def syncPlaylist(self, playlistId: int, ownerIds: List[int], trackIds: List[int], groupId: int = None, concurrency: int = 4) -> bool:
+        """
+        Приводит плейлист пользователя или группы к указанному списку треков. Вместо полной очистки и повторного добавления вычисляется минимальный набор изменений: удаляются только лишние треки, добавляются только недостающие, а перемещаются только треки, стоящие не на своём месте. Метод не работает для плейлистов, привязанных к чату.
+
+        `Пример использования`:
+
+        result = client.syncPlaylist(
+            playlistId=19201020,
+            ownerIds=[-2001471901, -2001471901],
+            trackIds=[123471901, 123471902],
+        )
+
+        print(result)
+
+        :param playlistId: идентификатор плейлиста. (``int``)
+        :param ownerIds: идентификаторы владельцев треков в нужном порядке. (``list[int]``)
+        :param trackIds: идентификаторы треков в нужном порядке. (``list[int]``)
+        :param groupId: идентификатор группы, в которой находится плейлист. (``int``, `optional`)
+        :param concurrency: максимальное количество одновременно отправляемых частей при удалении и добавлении треков. По умолчанию ``4``. (``int``, `optional`)
+        :return: `При успехе`: ``True``. `Если плейлист не найден или часть изменений не удалось применить`: ``False``.
+        """
+
+        if len(ownerIds) != len(trackIds):
+            self._raiseError("ownerIdsAndTrackIdsLenDifferent")
+
+        if not groupId:
+            groupId = await self._getMyId()
+
+        playlist = await self.getPlaylist(
+            playlistId,
+            groupId,
+        )
+
+        if not playlist:
+            return False
+
+        desiredIds = list(dict.fromkeys(f"{ownerId}_{trackId}" for ownerId, trackId in zip(ownerIds, trackIds)))
+        desiredIdsSet = set(desiredIds)
+
+        tracks = await self.getPlaylistTracks(
+            playlistId,
+            groupId,
+            True,
+        )
+
+        currentIds = [f"{track.ownerId}_{track.trackId}" for track in tracks or list()]
+
+        keptIds = list()
+        keptIdsSet = set()
+        idsToRemove = list()
+
+        # Лишними считаются и повторные вхождения нужного трека: в плейлисте остаётся только первое
+        for id in currentIds:
+            if id in desiredIdsSet and id not in keptIdsSet:
+                keptIds.append(id)
+                keptIdsSet.add(id)
+
+            else:
+                idsToRemove.append(id)
+
+        idsToAdd = [id for id in desiredIds if id not in keptIdsSet]
+        hasDuplicates = len(set(currentIds)) != len(currentIds)
+
+        success = True
+
+        if idsToRemove:
+            results = await self.remove(
+                [int(id.split("_")[0]) for id in idsToRemove],
+                [int(id.split("_")[1]) for id in idsToRemove],
+                playlistId,
+                groupId,
+                False,
+                concurrency,
+            )
+            success = all(results)
+
+        if idsToAdd:
+            # Добавленные треки попадают в начало плейлиста, поэтому добавляются в обратном порядке
+            results = await self.add(
+                [int(id.split("_")[0]) for id in idsToAdd[::-1]],
+                [int(id.split("_")[1]) for id in idsToAdd[::-1]],
+                playlistId,
+                groupId,
+                concurrency,
+            )
+            success = success and all(results)
+
+        result = await self._reorderPlaylist(
+            playlistId,
+            groupId,
+            desiredIds,
+            None if idsToAdd or hasDuplicates else keptIds,
+        )
+
+        if hasDuplicates:
+            tracks = await self.getPlaylistTracks(
+                playlistId,
+                groupId,
+                True,
+            )
+
+            result = result and [f"{track.ownerId}_{track.trackId}" for track in tracks or list()] == desiredIds
+
+        return success and result
+
+    sync_playlist = syncPlaylist
\ No newline at end of file
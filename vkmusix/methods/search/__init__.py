@@ -18,9 +18,14 @@
 
 from .search import Search
 from .searchArtists import SearchArtists
+from .iterSearchArtists import IterSearchArtists
 from .searchAlbums import SearchAlbums
+from .iterSearchAlbums import IterSearchAlbums
 from .searchTracks import SearchTracks
+from .iterSearchTracks import IterSearchTracks
 from .searchPlaylists import SearchPlaylists
+from .iterSearchPlaylists import IterSearchPlaylists
+from .searchMany import SearchMany
 from ._search import _Search
 
 from .getSearchTrends import GetSearchTrends
@@ -29,9 +34,14 @@ from .getSearchSuggestions import GetSearchSuggestions
 class Search(
     Search,
     SearchArtists,
+    IterSearchArtists,
     SearchAlbums,
+    IterSearchAlbums,
     SearchTracks,
+    IterSearchTracks,
     SearchPlaylists,
+    IterSearchPlaylists,
+    SearchMany,
     _Search,
 
     GetSearchTrends,
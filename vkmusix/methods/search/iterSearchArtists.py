@@ -0,0 +1,51 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class IterSearchArtists:
+    from vkmusix.paginator import Paginator
+
+    def iterSearchArtists(self, query: str, limit: int = None, offset: int = None, pageSize: int = 300) -> Paginator:
+        """
+        Лениво ищет артистов постранично.
+
+        `Пример использования`:
+
+        for artist in client.iterSearchArtists(
+            query="Маленький ярче",
+            limit=1000,
+        ):
+            print(artist)
+
+        :param query: поисковой запрос. (``str``)
+        :param limit: максимальное количество артистов. По умолчанию без ограничения. (``int``, `optional`)
+        :param offset: сколько артистов пропустить. (``int``, `optional`)
+        :param pageSize: количество артистов, получаемых за один запрос. По умолчанию ``300``. (``int``, `optional`)
+        :return: итератор по найденным артистам, поддерживающий ``for`` и ``async for`` (``Paginator``).
+        """
+
+        from vkmusix.paginator import Paginator
+
+        return Paginator.fromMethod(
+            self,
+            lambda count, offset: self.searchArtists(query, count, offset),
+            limit,
+            pageSize,
+            offset,
+        )
+
+    iter_search_artists = iterSearchArtists
\ No newline at end of file
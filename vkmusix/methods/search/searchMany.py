@@ -0,0 +1,124 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class SearchMany:
+    from typing import Union, List, Type
+
+    from vkmusix.aio import async_
+    from vkmusix.types import Artist, Album, Track, Playlist, SearchResults
+
+    searchCacheSize = 4096
+    searchCacheTTL = 600
+
+    @async_
+    async def searchMany(self, queries: List[str], kind: Union[List[Type[Union[Artist, Album, Track, Playlist]]], Type[Union[Artist, Album, Track, Playlist]]] = Track, limit: int = None, concurrency: int = 4, cacheTTL: float = None) -> List[Union[List[Union[Artist, Album, Track, Playlist]], SearchResults, None]]:
+        """
+        Выполняет несколько поисковых запросов одновременно. Одинаковые запросы (без учёта регистра и лишних пробелов) выполняются один раз, а результаты кэшируются, поэтому повторный поиск по тем же запросам не требует обращений к ВКонтакте.
+
+        `Пример использования`:
+
+        results = client.searchMany(
+            queries=["Маленький ярче — LARI LARI", "Маленький ярче — Лучшие дни"],
+            kind=types.Track,
+            limit=5,
+        )
+
+        print(results)
+
+        :param queries: поисковые запросы. (``list[str]``)
+        :param kind: тип искомых объектов: ``types.Track``, ``types.Album``, ``types.Playlist`` или ``types.Artist``. Список типов — поиск по всем разделам, как в ``client.search()``. По умолчанию ``types.Track``. (``Union[list[type], type]``, `optional`)
+        :param limit: лимит результатов на каждый запрос. (``int``, `optional`)
+        :param concurrency: максимальное количество одновременных запросов. По умолчанию ``4``. (``int``, `optional`)
+        :param cacheTTL: время жизни закэшированных результатов в секундах. ``0`` — не использовать кэш. Пустые результаты не кэшируются. По умолчанию ``600``. (``float``, `optional`)
+        :return: результаты в порядке ``queries`` (``list[Union[list, types.SearchResults, None]]``). `Если по запросу ничего не найдено или запрос пустой`: ``None`` на его месте.
+        """
+
+        from time import monotonic
+        from typing import Union
+
+        from vkmusix.types import Artist, Album, Track, Playlist, SearchResults
+        from vkmusix.utils import gatherWithConcurrency
+
+        methods = {
+            Artist: "searchArtists",
+            Album: "searchAlbums",
+            Track: "search",
+            Playlist: "searchPlaylists",
+        }
+
+        if isinstance(kind, list):
+            method = "searchMain"
+            kind = [Artist, Album, Track, Playlist]
+
+        else:
+            method = methods.get(kind, "search")
+
+        if cacheTTL is None:
+            cacheTTL = self.searchCacheTTL
+
+        cache = self._searchCache
+        now = monotonic()
+
+        keys = [
+            (method, " ".join(query.casefold().split()), limit) if query and query.strip() else None
+            for query in queries
+        ]
+
+        results = dict()
+        missingKeys = dict()
+
+        for key, query in zip(keys, queries):
+            if not key or key in results or key in missingKeys:
+                continue
+
+            cached = cache.get(key) if cacheTTL else None
+
+            if cached and cached[0] > now:
+                cache.move_to_end(key)
+                results[key] = cached[1]
+
+            else:
+                missingKeys[key] = query.strip()
+
+        async def searchOne(key: tuple, query: str) -> Union[list, SearchResults, None]:
+            result = await self._search(
+                method,
+                (query, limit, None),
+                kind,
+            )
+
+            # Пустой результат может быть следствием временного сбоя, поэтому не кэшируется
+            if cacheTTL and result is not None:
+                cache[key] = (monotonic() + cacheTTL, result)
+                cache.move_to_end(key)
+
+            return result
+
+        fetched = await gatherWithConcurrency(
+            (searchOne(key, query) for key, query in missingKeys.items()),
+            concurrency,
+        )
+
+        results.update(zip(missingKeys, fetched))
+
+        while len(cache) > self.searchCacheSize:
+            cache.popitem(last=False)
+
+        return [results.get(key) if key else None for key in keys]
+
+    search_many = searchMany
\ No newline at end of file
@@ -17,17 +17,26 @@
 #  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
 
 from .get import Get
+from .getMany import GetMany
+from .hydrate import Hydrate
 from .getLyrics import GetLyrics
+from ._getLyricsMany import _GetLyricsMany
 from .getRecommendations import GetRecommendations
+from .iterRecommendations import IterRecommendations
 
 from .add import Add
 from .remove import Remove
 
+from .preflightUpload import PreflightUpload
+from .matchTracks import MatchTracks
 from .upload import Upload
+from .uploadMany import UploadMany
+from ._uploadFile import _UploadFile
 from .edit import Edit
 from .restore import Restore
 
 from .download import Download
+from ._download import _Download
 
 from .getTracksFromFeed import GetTracksFromFeed
 from .getTracksFromChat import GetTracksFromChat
@@ -37,17 +46,26 @@ from ._parseWebTracks import _ParseWebTracks
 
 class Tracks(
     Get,
+    GetMany,
+    Hydrate,
     GetLyrics,
+    _GetLyricsMany,
     GetRecommendations,
+    IterRecommendations,
 
     Add,
     Remove,
 
+    PreflightUpload,
+    MatchTracks,
     Upload,
+    UploadMany,
+    _UploadFile,
     Edit,
     Restore,
 
     Download,
+    _Download,
 
     GetTracksFromFeed,
     GetTracksFromChat,
@@ -0,0 +1,316 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class _Download:
+    from typing import Union, List
+
+    from vkmusix.types import Track
+    from vkmusix.enums import Priority
+
+    segmentsConcurrency = 8
+
+    async def _download(self, ownerId: int, trackId: int, track: Union[Track, None], filename: Union[str, None], directory: Union[str, None], extensions: List[str], metadata: bool, priority: Priority) -> Union[List[str], None]:
+        from asyncio import get_event_loop
+        import os
+        import re
+        import uuid
+
+        import aiofiles
+        import aiofiles.os
+        from Crypto.Cipher import AES
+        from Crypto.Util.Padding import pad
+        import av
+
+        from vkmusix import web
+        from vkmusix.utils import gatherWithConcurrency
+
+        if not track or not track.fileUrl:
+            track = await self.get(ownerId, trackId)
+            if not track or not track.fileUrl:
+                return
+
+        def decryptSegment(segmentData: bytes, keyLocal: bytes, ivLocal: bytes) -> bytearray:
+            decryptor = AES.new(keyLocal, AES.MODE_CBC, ivLocal)
+
+            alignedSize = len(segmentData) - len(segmentData) % AES.block_size
+            decryptedData = bytearray(alignedSize if alignedSize == len(segmentData) else alignedSize + AES.block_size)
+            output = memoryview(decryptedData)
+
+            decryptor.decrypt(memoryview(segmentData)[:alignedSize], output=output[:alignedSize])
+
+            if alignedSize != len(segmentData):
+                decryptor.decrypt(pad(segmentData[alignedSize:], AES.block_size), output=output[alignedSize:])
+
+            return decryptedData
+
+        async def downloadSegment(segmentUrlLocal: str, keyLocal: bytes, ivLocal: bytes) -> None:
+            segmentData = await self._client(segmentUrlLocal, responseType=web.ResponseType.RESPONSE, priority=priority)
+            while segmentData.status_code in (301, 302):
+                segmentData = await self._client(segmentData.headers.get("Location"), responseType=web.ResponseType.RESPONSE, priority=priority)
+
+            if segmentData.status_code != 200:
+                return
+
+            segmentData = segmentData.content
+
+            if keyLocal:
+                segmentData = await get_event_loop().run_in_executor(None, decryptSegment, segmentData, keyLocal, ivLocal)
+
+            return segmentData
+
+        if not directory:
+            directory = os.getcwd()
+
+        else:
+            os.makedirs(directory, exist_ok=True)
+
+        if not filename:
+            filename = f"{track.artist} — {track.fullTitle}"
+
+        else:
+            for extension in extensions:
+                if filename.endswith(f".{extension}"):
+                    filename = filename[:-(len(extension) + 1)]
+                    break
+
+            if "{subtitle}" in filename and not track.subtitle:
+                filename = filename.replace("{subtitle}", str())
+                filename = filename.strip()
+
+            if "{album}" in filename and not track.album:
+                filename = filename.replace("{album}", str())
+                filename = filename.strip()
+
+            filename = filename.format(
+                artist=track.artist,
+                title=track.title,
+                subtitle=track.subtitle,
+                fullTitle=track.fullTitle,
+                album=track.album.title if track.album else None,
+            )
+
+        filename = re.sub(r'[<>:"/\\|?*]', str(), filename)
+        filename = os.path.join(directory, filename)
+
+        key = None
+        iv = bytes.fromhex("00000000000000000000000000000000")
+        segmentsArgs = list()
+
+        while True:
+            m3u8Content = await self._client(
+                track.fileUrl,
+                responseType=web.ResponseType.RESPONSE,
+                priority=priority,
+            )
+
+            if m3u8Content:
+                break
+
+        while m3u8Content.status_code in (301, 302):
+            while True:
+                m3u8Content = await self._client(
+                    m3u8Content.headers.get("Location"),
+                    responseType=web.ResponseType.RESPONSE,
+                    priority=priority,
+                )
+
+                if m3u8Content:
+                    break
+
+        if m3u8Content.status_code != 200:
+            return
+
+        for line in m3u8Content.text.splitlines():
+            if line.startswith("#EXT-X-KEY"):
+                method = line.split("METHOD=")[1].split(",")[0]
+
+                if method == "AES-128":
+                    if not key:
+                        keyUri = line.split('URI="')[1].split('"')[0]
+                        response = await self._client(keyUri, responseType=web.ResponseType.RESPONSE, priority=priority)
+                        contentType = response.headers.get("content-type")
+                        key = response.content if contentType and contentType == "application/octet-stream" else response.text.encode()
+
+                    keyLocal = key
+
+                elif method == "NONE":
+                    keyLocal = None
+
+            elif line.endswith((".ts", ".ts?siren=1")):
+                segmentUrl = os.path.join(os.path.dirname(track.fileUrl), line)
+                segmentsArgs.append((str(segmentUrl), keyLocal, iv))
+
+        # Сегменты скачиваются ограниченным числом одновременных запросов, чтобы длинный трек не открывал десятки соединений сразу
+        segments = await gatherWithConcurrency(
+            (downloadSegment(*segmentArgs) for segmentArgs in segmentsArgs),
+            self.segmentsConcurrency,
+        )
+
+        tempFilename = f"{filename}.{uuid.uuid4().hex}"
+
+        try:
+            async with aiofiles.open(f"{tempFilename}.ts", "wb") as outfile:
+                await outfile.writelines(segment for segment in segments if segment)
+
+            outputExtensions = [extension for extension in extensions if extension != "ts"]
+
+            if outputExtensions:
+                transcodedExtensions = [extension for extension in outputExtensions if extension == "opus"]
+                remuxedExtensions = [extension for extension in outputExtensions if extension not in transcodedExtensions]
+
+                try:
+                    inputContainer = av.open(f"{tempFilename}.ts")
+                    inputStream = inputContainer.streams.audio[0]
+
+                    outputContainers = dict()
+                    outputStreams = dict()
+
+                    for extension in outputExtensions:
+                        outputContainer = av.open(f"{tempFilename}.{extension}", mode="w", format=extension)
+                        outputStream = outputContainer.add_stream(extension, rate=inputStream.rate if extension != "opus" else 48000)
+
+                        if extension == "opus":
+                            outputStream.codec_context.options = {
+                                "strict": "experimental",
+                            }
+
+                        outputContainers[extension] = outputContainer
+                        outputStreams[extension] = outputStream
+
+                    for packet in inputContainer.demux(inputStream):
+                        if packet.stream != inputStream or packet.stream_index != inputStream.index:
+                            continue
+
+                        if transcodedExtensions and packet.size > 0:
+                            try:
+                                frames = packet.decode()
+
+                            except av.error.InvalidDataError:
+                                frames = list()
+
+                            for frame in frames:
+                                for extension in transcodedExtensions:
+                                    newPacket = outputStreams[extension].encode(frame)
+
+                                    if newPacket:
+                                        outputContainers[extension].mux(newPacket)
+
+                        # Муксер забирает пакет себе, поэтому копирование без перекодирования выполняется последним
+                        for extension in remuxedExtensions:
+                            outputContainers[extension].mux(packet)
+
+                    for extension in transcodedExtensions:
+                        newPacket = outputStreams[extension].encode()
+
+                        if newPacket:
+                            outputContainers[extension].mux(newPacket)
+
+                    inputContainer.close()
+
+                    for outputContainer in outputContainers.values():
+                        outputContainer.close()
+
+                except (av.InvalidDataError, av.ValueError, av.BlockingIOError):
+                    return
+
+                if metadata:
+                    album = track.album
+                    photo = album.photo if album else None
+
+                    coverData = await self._client(
+                        photo.get(1200) or photo.get(600) or photo.get(300) or photo.get(270),
+                        responseType=web.ResponseType.FILE,
+                        priority=priority,
+                    ) if photo else None
+
+                    for extension in outputExtensions:
+                        if extension == "mp3":
+                            from mutagen.id3 import ID3, APIC, TIT2, TPE1, TALB
+                            from mutagen.mp3 import MP3
+
+                            audio = MP3(f"{tempFilename}.{extension}", ID3=ID3)
+                            audio.update(
+                                {
+                                    **{
+                                        "TIT2": TIT2(encoding=1, text=[track.fullTitle]),
+                                        "TPE1": TPE1(encoding=1, text=[track.artist]),
+                                    },
+                                    **({
+                                        "TALB": TALB(encoding=1, text=[album.title]),
+                                    } if album else dict()),
+                                },
+                            )
+
+                            if coverData:
+                                audio.tags.add(
+                                    APIC(
+                                        encoding=1,
+                                        mime="image/jpeg",
+                                        type=3,
+                                        data=coverData,
+                                    )
+                                )
+
+                        elif extension == "opus":
+                            from mutagen.oggopus import OggOpus
+
+                            audio = OggOpus(f"{tempFilename}.{extension}")
+                            audio.update(
+                                {
+                                    "title": track.fullTitle,
+                                    "artist": track.artist,
+                                    **({
+                                        "album": album.title,
+                                    } if album else dict()),
+                                },
+                            )
+
+                            if coverData:
+                                import base64
+                                from mutagen.flac import Picture
+
+                                picture = Picture()
+
+                                picture.data = coverData
+
+                                picture.type = 3
+                                picture.mime = "image/jpeg"
+
+                                resolution = next((x for x in [1200, 600, 300, 270] if photo.get(x)), 1200)
+                                picture.width = resolution
+                                picture.height = resolution
+
+                                picture.depth = 24
+
+                                encodedPicture = base64.b64encode(picture.write()).decode("ascii")
+                                audio["metadata_block_picture"] = [encodedPicture]
+
+                        else:
+                            continue
+
+                        audio.save()
+
+            for extension in extensions:
+                await aiofiles.os.replace(f"{tempFilename}.{extension}", f"{filename}.{extension}")
+
+        finally:
+            for extension in ["ts"] + extensions:
+                if os.path.exists(f"{tempFilename}.{extension}"):
+                    await aiofiles.os.remove(f"{tempFilename}.{extension}")
+
+        return [f"{filename}.{extension}" for extension in extensions]
\ No newline at end of file
@@ -0,0 +1,82 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class _GetLyricsMany:
+    from typing import Union, List, Dict
+
+    lyricsCacheSize = 4096
+
+    async def _getLyricsMany(self, ids: List[str], concurrency: int = 4) -> Dict[str, Union[dict, None]]:
+        from typing import Union, Tuple
+
+        from vkmusix.utils import gatherWithConcurrency
+
+        cache = self._lyricsCache
+
+        missingIds = [id for id in dict.fromkeys(ids) if id not in cache]
+
+        async def fetch(id: str) -> Tuple[Union[dict, None], bool]:
+            response = await self._req(
+                "getLyrics",
+                {
+                    "audio_id": id,
+                },
+            )
+
+            # Кэшируется только ответ API без ошибки: пустой ответ или словарь ошибки может быть временным сбоем
+            if not response or not isinstance(response, dict) or "error_code" in response:
+                return None, False
+
+            return response.get("lyrics") or None, True
+
+        responses = await gatherWithConcurrency(
+            (fetch(id) for id in missingIds),
+            concurrency,
+        )
+
+        fetched = dict()
+
+        for id, (trackLyrics, cacheable) in zip(missingIds, responses):
+            fetched[id] = trackLyrics
+
+            if cacheable:
+                cache[id] = trackLyrics
+
+        for id in ids:
+            if id in cache:
+                cache.move_to_end(id)
+
+        result = {
+            id: fetched[id] if id in fetched else cache.get(id)
+            for id in ids
+        }
+
+        while len(cache) > self.lyricsCacheSize:
+            cache.popitem(last=False)
+
+        return result
+
+
+    @staticmethod
+    def _lyricsToText(lyrics: Union[dict, None]) -> Union[str, None]:
+        if not lyrics:
+            return
+
+        timestamps = lyrics.get("timestamps")
+
+        return "\n".join([line.get("line") for line in timestamps if line.get("line") is not None]) if timestamps else lyrics.get("text")
\ No newline at end of file
@@ -23,7 +23,7 @@ class _ParseAPITracks:
     from vkmusix.types import Track
 
     @async_
-    async def _parseAPITracks(self, tracks: Union[List[Dict[str, str]], None]) -> Union[List[Track], None]:
+    async def _parseAPITracks(self, tracks: Union[List[Dict[str, str]], None], hydrate: bool = False) -> Union[List[Track], None]:
         from vkmusix.types import Track
 
         if not tracks:
@@ -44,4 +44,9 @@ class _ParseAPITracks:
                 "track_id": int(trackId),
             }
 
-        return self._finalizeResponse(tracks, Track)
\ No newline at end of file
+        tracks = self._finalizeResponse(tracks, Track)
+
+        if hydrate:
+            await self.hydrate(tracks)
+
+        return tracks
\ No newline at end of file
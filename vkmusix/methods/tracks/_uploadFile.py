@@ -0,0 +1,167 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class _UploadFile:
+    from typing import Union, Tuple, AsyncIterable, BinaryIO
+
+    from vkmusix.enums import Priority
+
+    chunkSize = 64 * 1024
+    maxFileSizeInBytes = 200 * 1024 * 1024
+
+    def _prepareUploadFile(self, filename: Union[str, None], file: Union[BinaryIO, AsyncIterable[bytes], None]) -> Tuple[str, Union[int, None]]:
+        import os
+        from asyncio import iscoroutinefunction
+
+        from vkmusix.utils import checkFile
+
+        if file is None:
+            if not filename:
+                self._raiseError("MP3FileNotFound")
+
+            if filename.endswith(".mp3"):
+                filename = filename[:-4]
+
+            filename = checkFile(f"{filename}.mp3")
+            if not filename:
+                self._raiseError("MP3FileNotFound")
+
+            fileSizeInBytes = os.path.getsize(filename)
+
+            if fileSizeInBytes > self.maxFileSizeInBytes:
+                self._raiseError("MP3FileTooBig")
+
+            return filename, fileSizeInBytes
+
+        if not filename:
+            filename = getattr(file, "name", None) if isinstance(getattr(file, "name", None), str) else "audio.mp3"
+
+        fileSizeInBytes = None
+
+        if hasattr(file, "seek") and not iscoroutinefunction(file.seek):
+            try:
+                position = file.tell()
+                fileSizeInBytes = file.seek(0, os.SEEK_END) - position
+                file.seek(position)
+
+            except (OSError, ValueError):
+                fileSizeInBytes = None
+
+        if fileSizeInBytes and fileSizeInBytes > self.maxFileSizeInBytes:
+            self._raiseError("MP3FileTooBig")
+
+        return filename, fileSizeInBytes
+
+
+    async def _uploadFile(self, uploadUrl: str, filename: str, file: Union[BinaryIO, AsyncIterable[bytes], None], fileSizeInBytes: Union[int, None], priority: Priority, progress: Union[callable, None]) -> Union[dict, None]:
+        from typing import AsyncIterable
+        from asyncio import get_event_loop, iscoroutinefunction
+        from inspect import isawaitable
+
+        import aiofiles
+
+        from vkmusix import web
+
+        chunkSize = self.chunkSize
+        maxFileSizeInBytes = self.maxFileSizeInBytes
+
+        rewind = None
+
+        if file is None:
+            rewind = lambda: True
+
+        elif hasattr(file, "read") and hasattr(file, "seek") and hasattr(file, "tell"):
+            try:
+                startPosition = file.tell()
+
+                if isawaitable(startPosition):
+                    startPosition = await startPosition
+
+            except (OSError, ValueError):
+                startPosition = None
+
+            if startPosition is not None:
+                def rewind() -> any:
+                    return file.seek(startPosition)
+
+        async def readChunks() -> AsyncIterable[bytes]:
+            if file is None:
+                async with aiofiles.open(filename, "rb") as source:
+                    while True:
+                        chunk = await source.read(chunkSize)
+
+                        if not chunk:
+                            break
+
+                        yield chunk
+
+            elif hasattr(file, "read"):
+                while True:
+                    if iscoroutinefunction(file.read):
+                        chunk = await file.read(chunkSize)
+
+                    else:
+                        chunk = await get_event_loop().run_in_executor(None, file.read, chunkSize)
+
+                    if not chunk:
+                        break
+
+                    yield chunk
+
+            else:
+                async for chunk in file:
+                    yield chunk
+
+        async def readFile() -> AsyncIterable[bytes]:
+            uploaded = 0
+
+            async for chunk in readChunks():
+                uploaded += len(chunk)
+
+                if uploaded > maxFileSizeInBytes:
+                    self._raiseError("MP3FileTooBig")
+
+                yield chunk
+
+                if progress:
+                    result = progress(uploaded, fileSizeInBytes)
+
+                    if isawaitable(result):
+                        await result
+
+        body = web.MultipartStream(
+            "file",
+            filename if filename.endswith(".mp3") else f"{filename}.mp3",
+            "audio/mpeg",
+            readFile,
+            fileSizeInBytes,
+            rewind,
+        )
+
+        uploadingFileResponse = await self._client(
+            uploadUrl,
+            headers=body.headers,
+            method=web.Method.POST,
+            priority=priority,
+            content=body,
+        )
+
+        if not uploadingFileResponse or not isinstance(uploadingFileResponse, dict) or not uploadingFileResponse.get("audio"):
+            return
+
+        return uploadingFileResponse
\ No newline at end of file
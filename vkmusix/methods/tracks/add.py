@@ -22,7 +22,7 @@ class Add:
     from vkmusix.aio import async_
 
     @async_
-    async def add(self, ownerIds: Union[List[int], int], trackIds: Union[List[int], int], playlistId: int = None, groupId: int = None) -> Union[List[bool], bool]:
+    async def add(self, ownerIds: Union[List[int], int], trackIds: Union[List[int], int], playlistId: int = None, groupId: int = None, concurrency: int = 1, keepOrder: bool = True, progress: callable = None) -> Union[List[bool], bool]:
         """
         Добавляет треки в музыку или плейлист пользователя или группы.
 
@@ -39,12 +39,16 @@ class Add:
         :param trackIds: идентификаторы треков. (``Union[list[int], int]``)
         :param playlistId: идентификатор плейлиста, в который необходимо добавить треки. (``int``, `optional`)
         :param groupId: идентификатор группы, в музыку или плейлист которой необходимо добавить треки. (``int``, `optional`)
+        :param concurrency: максимальное количество одновременных запросов. Треки в музыку добавляются по одному, в плейлист — частями по 50. По умолчанию ``1``: запросы отправляются последовательно и порядок треков сохраняется. При значении больше ``1`` запросы отправляются параллельно: порядок частей в плейлисте не гарантируется, а порядок в музыке восстанавливается согласно ``keepOrder``. (``int``, `optional`)
+        :param keepOrder: флаг, указывающий, необходимо ли после параллельного добавления в музыку (``concurrency`` больше ``1``) восстановить такой же порядок, как при последовательном добавлении (последний трек сверху). Перемещаются только треки, оказавшиеся не на своём месте. По умолчанию ``True``. (``bool``, `optional`)
+        :param progress: функция, вызываемая после каждого запроса на добавление с аргументами ``(processed, total)`` — количество обработанных треков и их общее количество. Может быть асинхронной. (``callable``, `optional`)
         :return: `Если треков несколько`: статусы добавления треков (``list[bool]``). `Если трек один`: статус добавления трека (``bool``). `При успехе`: ``True``. `Если трек не удалось добавить`: ``False``.
         """
 
-        from itertools import islice
+        from inspect import isawaitable
 
-        from vkmusix.errors import AccessDenied
+        from vkmusix.errors import Error
+        from vkmusix.utils import chunks, gatherWithConcurrency
 
         if type(ownerIds) != type(trackIds):
             self._raiseError("ownerIdsAndTrackIdsTypeDifferent")
@@ -58,22 +62,28 @@ class Add:
             ownerIds = [ownerIds]
             trackIds = [trackIds]
 
+        myId = await self._getMyId()
+
         if not groupId:
-            groupId = await self._getMyId()
+            groupId = myId
 
-        method = "add"
-        if playlistId:
-            method += "ToPlaylist"
+        processedCount = [0]
 
-        results = list()
+        async def reportProgress(count: int) -> None:
+            processedCount[0] += count
 
-        if playlistId:
-            def chunks(iterable):
-                iterator = iter(iterable)
-                for first in iterator:
-                    yield [first] + list(islice(iterator, 49))
+            if progress:
+                result = progress(processedCount[0], len(trackIds))
+
+                if isawaitable(result):
+                    await result
 
-            for trackChunk in chunks(zip(ownerIds, trackIds)):
+        def isSuccess(response: any) -> bool:
+            # Необработанную ошибку _req возвращает словарём с её кодом
+            return bool(response) and not (isinstance(response, dict) and "error_code" in response)
+
+        if playlistId:
+            async def addChunk(trackChunk: list) -> list:
                 ids = ",".join(
                     f"{ownerId}_{trackId}"
                     for ownerId, trackId in trackChunk
@@ -81,7 +91,7 @@ class Add:
 
                 try:
                     response = await self._req(
-                        method,
+                        "addToPlaylist",
                         {
                             "owner_id": groupId,
                             "audio_ids": ids,
@@ -89,26 +99,69 @@ class Add:
                         },
                     )
 
-                    results.append([bool(response)] * len(trackChunk))
+                    results = [isSuccess(response)] * len(trackChunk)
 
-                except AccessDenied:
-                    print(1)
-                    results.extend([False] * len(trackChunk))
+                except Error:
+                    results = [False] * len(trackChunk)
 
-        else:
-            for ownerId, trackId in zip(ownerIds, trackIds):
-                try:
-                    response = await self._req(
-                        method,
-                        {
-                            "owner_id": ownerId,
-                            "audio_id": trackId,
-                            "group_id": groupId,
-                        },
-                    )
-                    results.append(bool(response))
+                await reportProgress(len(trackChunk))
+
+                return results
+
+            chunksResults = await gatherWithConcurrency(
+                (addChunk(trackChunk) for trackChunk in chunks(zip(ownerIds, trackIds), 50)),
+                concurrency,
+            )
 
-                except AccessDenied:
-                    results.append(False)
+            results = [
+                result
+                for chunkResults in chunksResults
+                for result in chunkResults
+            ]
+
+            return results if wasList else results[0]
+
+        async def addOne(ownerId: int, trackId: int) -> int:
+            try:
+                response = await self._req(
+                    "add",
+                    {
+                        "owner_id": ownerId,
+                        "audio_id": trackId,
+                        "group_id": groupId,
+                    },
+                )
+
+            except Error:
+                response = None
+
+            await reportProgress(1)
+
+            return response
+
+        responses = await gatherWithConcurrency(
+            (addOne(ownerId, trackId) for ownerId, trackId in zip(ownerIds, trackIds)),
+            concurrency,
+        )
+
+        results = [isSuccess(response) for response in responses]
+
+        addedTrackIds = [
+            response
+            for response in responses
+            if isinstance(response, int) and not isinstance(response, bool)
+        ]
+
+        if keepOrder and concurrency != 1 and len(addedTrackIds) > 1:
+            libraryOwnerId = groupId if groupId == myId else -abs(groupId)
+            libraryTracks = await self._getLibraryTracks(libraryOwnerId, False)
+
+            if libraryTracks:
+                await self._reorderTracks(
+                    libraryOwnerId,
+                    [track.trackId for track in libraryTracks if track.ownerId == libraryOwnerId],
+                    addedTrackIds[::-1],
+                    concurrency,
+                )
 
         return results if wasList else results[0]
\ No newline at end of file
@@ -37,16 +37,12 @@ class Get:
 
         print(track)
 
-        :param ownerIds: идентификаторы владельцев треков. Максимум 343. (``Union[list[int], int]``)
-        :param trackIds: идентификаторы треков. Максимум 343. (``Union[list[int], int]``)
+        :param ownerIds: идентификаторы владельцев треков. Количество не ограничено, при необходимости запросы разбиваются на части через ``client.getMany()``. (``Union[list[int], int]``)
+        :param trackIds: идентификаторы треков. (``Union[list[int], int]``)
         :param includeLyrics: флаг, указывающий, небходимо ли также получить текст. (``bool``, `optional`)
         :return: `Если треков несколько`: информация о треках (``list[types.Track]``). `Если трек один`: информация о треке (``types.Track``). `При успехе`: информация о треке (``types.Track``). `Если трек не найден`: ``None``.
         """
 
-        from asyncio import gather
-
-        from vkmusix.types import Track
-
         if type(ownerIds) != type(trackIds):
             self._raiseError("ownerIdsAndTrackIdsTypeDifferent")
 
@@ -59,46 +55,17 @@ class Get:
             ownerIds = [ownerIds]
             trackIds = [trackIds]
 
-        ids =  [
-            f"{ownerId}_{trackId}"
-            for ownerId, trackId in zip(
+        tracks = [
+            track
+            for track in await self.getMany(
                 ownerIds,
                 trackIds,
+                includeLyrics,
             )
+            if track
         ]
 
-        tasks = [
-            self._req(
-                "getById",
-                {
-                    "audios": ",".join(ids),
-                },
-            ),
-        ]
-
-        if includeLyrics:
-            for id in ids:
-                ownerId, trackId = id.split("_")
-                tasks.append(
-                    self.getLyrics(
-                        ownerId,
-                        trackId,
-                    ),
-                )
-
-        responses = await gather(*tasks)
-
-        tracks = responses[0]
         if not tracks:
             return
 
-        if not isinstance(tracks, list):
-            tracks = [tracks]
-
-        if includeLyrics:
-            lyrics = responses[1:]
-
-            for idx, track in enumerate(tracks):
-                track["lyrics"] = lyrics[idx] if lyrics else None
-
-        return self._finalizeResponse(tracks if wasList else tracks[0], Track)
\ No newline at end of file
+        return tracks if wasList else tracks[0]
\ No newline at end of file
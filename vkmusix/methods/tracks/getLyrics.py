@@ -17,12 +17,12 @@
 #  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
 
 class GetLyrics:
-    from typing import Union
+    from typing import Union, List
 
     from vkmusix.aio import async_
 
     @async_
-    async def getLyrics(self, ownerId: int, trackId: int) -> Union[str, None]:
+    async def getLyrics(self, ownerId: int, trackId: int, timestamps: bool = False) -> Union[str, List[dict], None]:
         """
         Получает текст трека.
 
@@ -37,26 +37,17 @@ class GetLyrics:
 
         :param ownerId: идентификатор владельца трека. (``int``)
         :param trackId: идентификатор трека. (``int``)
-        :return: `При успехе`: текст трека (``str``). `Если трек не найден или текст отсутствует`: ``None``.
+        :param timestamps: флаг, указывающий, необходимо ли вернуть строки текста с временными метками вместо сплошного текста. По умолчанию ``False``. (``bool``, `optional`)
+        :return: `При успехе`: текст трека (``str``) или, если указан ``timestamps``, строки текста в формате ``{"line": str, "begin": int, "end": int}`` (``list[dict]``). `Если трек не найден или текст отсутствует`: ``None``.
         """
 
-        lyrics = await self._req(
-            "getLyrics",
-            {
-                "audio_id": f"{ownerId}_{trackId}",
-            },
-        )
-
-        if not lyrics:
-            return
-
-        lyrics = lyrics.get("lyrics")
+        id = f"{ownerId}_{trackId}"
 
-        if not lyrics:
-            return
+        lyrics = (await self._getLyricsMany([id])).get(id)
 
-        timestamps = lyrics.get("timestamps")
+        if timestamps:
+            return lyrics.get("timestamps") if lyrics else None
 
-        return "\n".join([line.get("line") for line in timestamps if line.get("line") is not None]) if timestamps else lyrics.get("text")
+        return self._lyricsToText(lyrics)
 
     get_lyrics = getLyrics
\ No newline at end of file
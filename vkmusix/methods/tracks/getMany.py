@@ -0,0 +1,129 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class GetMany:
+    from typing import Union, List
+
+    from vkmusix.aio import async_
+    from vkmusix.types import Track
+
+    maxIdsPerRequest = 343
+
+    @async_
+    async def getMany(self, ownerIds: List[int], trackIds: List[int], includeLyrics: bool = False, concurrency: int = 4) -> List[Union[Track, None]]:
+        """
+        Получает информацию о любом количестве треков. Идентификаторы делятся на равные части не больше 343 штук, которые запрашиваются параллельно.
+
+        `Пример использования`:
+
+        tracks = client.getMany(
+            ownerIds=[-2001471901, -2001471901],
+            trackIds=[123471901, 123471902],
+        )
+
+        notFound = [
+            f"{ownerId}_{trackId}"
+            for ownerId, trackId, track in zip(ownerIds, trackIds, tracks)
+            if not track
+        ]
+
+        print(tracks, notFound)
+
+        :param ownerIds: идентификаторы владельцев треков. (``list[int]``)
+        :param trackIds: идентификаторы треков. (``list[int]``)
+        :param includeLyrics: флаг, указывающий, небходимо ли также получить текст. (``bool``, `optional`)
+        :param concurrency: максимальное количество одновременных запросов. По умолчанию ``4``. (``int``, `optional`)
+        :return: Информация о треках в порядке переданных идентификаторов, ``None`` на месте не найденных треков (``list[Union[types.Track, None]]``).
+        """
+
+        from math import ceil
+
+        from vkmusix.types import Track
+        from vkmusix.utils import chunks, gatherWithConcurrency
+
+        if type(ownerIds) != type(trackIds):
+            self._raiseError("ownerIdsAndTrackIdsTypeDifferent")
+
+        elif isinstance(ownerIds, list) and isinstance(trackIds, list) and len(ownerIds) != len(trackIds):
+            self._raiseError("ownerIdsAndTrackIdsLenDifferent")
+
+        if not all((isinstance(ownerIds, list), isinstance(trackIds, list))):
+            ownerIds = [ownerIds]
+            trackIds = [trackIds]
+
+        ids = [
+            f"{ownerId}_{trackId}"
+            for ownerId, trackId in zip(
+                ownerIds,
+                trackIds,
+            )
+        ]
+
+        uniqueIds = list(dict.fromkeys(ids))
+
+        if not uniqueIds:
+            return list()
+
+        chunkSize = ceil(len(uniqueIds) / ceil(len(uniqueIds) / self.maxIdsPerRequest))
+
+        batches = await gatherWithConcurrency(
+            (
+                self._req(
+                    "getById",
+                    {
+                        "audios": ",".join(idsChunk),
+                    },
+                )
+                for idsChunk in chunks(uniqueIds, chunkSize)
+            ),
+            concurrency,
+        )
+
+        foundTracks = dict()
+
+        for batch in batches:
+            if not batch:
+                continue
+
+            if not isinstance(batch, list):
+                batch = [batch]
+
+            for track in batch:
+                if isinstance(track, dict) and track.get("id") is not None and not track.get("error_code"):
+                    foundTracks[f"{track.get('owner_id')}_{track.get('id')}"] = track
+
+        if includeLyrics:
+            lyrics = await self._getLyricsMany(
+                [
+                    id
+                    for id in uniqueIds
+                    if id in foundTracks and foundTracks[id].get("has_lyrics") is not False
+                ],
+                concurrency,
+            )
+
+            for id, track in foundTracks.items():
+                track["lyrics"] = self._lyricsToText(lyrics.get(id))
+                track["lyrics_timestamps"] = lyrics.get(id).get("timestamps") if lyrics.get(id) else None
+
+        return [
+            self._finalizeResponse(foundTracks[id], Track) if id in foundTracks else None
+            for id in ids
+        ]
+
+    get_many = getMany
\ No newline at end of file
@@ -23,7 +23,7 @@ class GetTracksFromFeed:
     from vkmusix.types import Track
 
     @async_
-    async def getTracksFromFeed(self) -> Union[List[Track], None]:
+    async def getTracksFromFeed(self, hydrate: bool = False) -> Union[List[Track], None]:
         """
         Получает треки из новостной ленты.
 
@@ -33,6 +33,7 @@ class GetTracksFromFeed:
 
         print(tracks)
 
+        :param hydrate: флаг, указывающий, необходимо ли сразу получить полную информацию о треках через ``client.hydrate()``. Иначе у треков известны только идентификаторы. По умолчанию ``False``. (``bool``, `optional`)
         :return: `При успехе`: треки (``list[types.Track]``). `Если треки отсутствуют`: ``None``.
         """
 
@@ -43,7 +44,7 @@ class GetTracksFromFeed:
             },
         )).get("audios")
 
-        tracks = await self._parseAPITracks(tracks)
+        tracks = await self._parseAPITracks(tracks, hydrate)
 
         return tracks
 
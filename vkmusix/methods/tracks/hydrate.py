@@ -0,0 +1,84 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class Hydrate:
+    from typing import Union, List
+
+    from vkmusix.aio import async_
+    from vkmusix.types import Track
+
+    @async_
+    async def hydrate(self, tracks: Union[List[Track], Track], includeLyrics: bool = False, lazy: bool = False, concurrency: int = 4) -> Union[List[Track], Track, None]:
+        """
+        Дополняет треки, у которых известны только идентификаторы (например, полученные через ``client.getTracks()``, ``client.getTracksFromWall()``, ``client.getTracksFromFeed()`` или ``client.getSection()``), полной информацией. Треки заполняются на месте, поэтому ссылки на них остаются действительными, а уже заполненные треки пропускаются. Информация запрашивается частями по 343 трека через ``client.getMany()``.
+
+        `Пример использования`:
+
+        tracks = client.getTracksFromWall(
+            ownerId=-28905875,
+        )
+
+        client.hydrate(tracks)
+
+        print(tracks)
+
+        :param tracks: треки. (``Union[list[types.Track], types.Track]``)
+        :param includeLyrics: флаг, указывающий, небходимо ли также получить текст. (``bool``, `optional`)
+        :param lazy: флаг, указывающий, необходимо ли отложить запросы до первого обращения к незаполненному атрибуту любого из треков. Тогда будут заполнены сразу все переданные треки. Работает только при синхронном использовании. По умолчанию ``False``. (``bool``, `optional`)
+        :param concurrency: максимальное количество одновременных запросов. По умолчанию ``4``. (``int``, `optional`)
+        :return: Те же треки (``Union[list[types.Track], types.Track]``).
+        """
+
+        from vkmusix.types import Track
+
+        if not tracks:
+            return tracks
+
+        stubs = [
+            track
+            for track in (tracks if isinstance(tracks, list) else [tracks])
+            if isinstance(track, Track) and track._isStub()
+        ]
+
+        if not stubs:
+            return tracks
+
+        if lazy:
+            for stub in stubs:
+                stub._makeLazy(stubs)
+
+            return tracks
+
+        fullTracks = {
+            track.id: track
+            for track in await self.getMany(
+                [stub.ownerId for stub in stubs],
+                [stub.trackId for stub in stubs],
+                includeLyrics,
+                concurrency,
+            )
+            if track
+        }
+
+        for stub in stubs:
+            fullTrack = fullTracks.get(stub.id)
+
+            if fullTrack or stub.__dict__.get("_lazyGroup") is not None:
+                stub._fill(fullTrack.raw if fullTrack else stub.raw)
+
+        return tracks
\ No newline at end of file
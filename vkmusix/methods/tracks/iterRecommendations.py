@@ -0,0 +1,51 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class IterRecommendations:
+    from vkmusix.paginator import Paginator
+
+    def iterRecommendations(self, limit: int = None, offset: int = None, ownerId: int = None, trackId: int = None, pageSize: int = 100) -> Paginator:
+        """
+        Лениво получает пользовательские рекомендации, или рекомендации по треку, если заполнены параметры ``ownerId`` и ``trackId``, постранично.
+
+        `Пример использования`:
+
+        for track in client.iterRecommendations(
+            limit=500,
+        ):
+            print(track)
+
+        :param limit: максимальное количество треков. По умолчанию без ограничения. (``int``, `optional`)
+        :param offset: сколько треков пропустить. (``int``, `optional`)
+        :param ownerId: идентификатор владельца трека. (``int``, `optional`)
+        :param trackId: идентификатор трека. (``int``, `optional`)
+        :param pageSize: количество треков, получаемых за один запрос. По умолчанию ``100``. (``int``, `optional`)
+        :return: итератор по рекомендованным трекам, поддерживающий ``for`` и ``async for`` (``Paginator``).
+        """
+
+        from vkmusix.paginator import Paginator
+
+        return Paginator.fromMethod(
+            self,
+            lambda count, offset: self.getRecommendations(count, offset, ownerId, trackId),
+            limit,
+            pageSize,
+            offset,
+        )
+
+    iter_recommendations = iterRecommendations
\ No newline at end of file
@@ -0,0 +1,149 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class MatchTracks:
+    from typing import Union, List
+
+    from vkmusix.aio import async_
+    from vkmusix.types import Track
+
+    matchDurationToleranceInSeconds = 2
+
+    @async_
+    async def matchTracks(self, artists: List[Union[str, None]], titles: List[str], durations: List[Union[int, None]] = None, limit: int = 10, minScore: float = 0.6, concurrency: int = 4, durationToleranceInSeconds: int = None) -> List[Union[Track, None]]:
+        """
+        Находит треки ВКонтакте, соответствующие трекам из внешних источников (например, строкам плейлиста CSV или M3U). Названия и артисты нормализуются (регистр, «feat.», скобки, транслитерация), кандидаты из поиска оцениваются по сходству триграмм и длительности. Поисковые запросы выполняются одновременно через ``client.searchMany()`` и кэшируются; для строк, не найденных по артисту и названию, выполняется повторный поиск только по названию.
+
+        `Пример использования`:
+
+        tracks = client.matchTracks(
+            artists=["Маленький ярче", "Pyrokinesis"],
+            titles=["LARI LARI", "Легенда о Богине Гроз"],
+            durations=[178, None],
+        )
+
+        print(tracks)
+
+        :param artists: артисты. (``list[Union[str, None]]``)
+        :param titles: названия треков. (``list[str]``)
+        :param durations: длительности треков в секундах. (``list[Union[int, None]]``, `optional`)
+        :param limit: количество кандидатов из поиска на каждый трек. По умолчанию ``10``. (``int``, `optional`)
+        :param minScore: минимальная оценка соответствия от ``0`` до ``1``. По умолчанию ``0.6``. (``float``, `optional`)
+        :param concurrency: максимальное количество одновременных запросов. По умолчанию ``4``. (``int``, `optional`)
+        :param durationToleranceInSeconds: допустимое отклонение длительности в секундах. По умолчанию ``2``. (``int``, `optional`)
+        :return: найденные треки в порядке входных данных (``list[Union[types.Track, None]]``). `Если трек не найден`: ``None`` на его месте.
+        """
+
+        from typing import Union, List
+
+        from vkmusix.types import Track
+        from vkmusix.utils import cleanTrackText, normalizeTrackText, trigrams, similarity
+
+        if durations is None:
+            durations = [None] * len(titles)
+
+        if len(artists) != len(titles) or len(durations) != len(titles):
+            self._raiseError("artistsAndTitlesLenDifferent")
+
+        if durationToleranceInSeconds is None:
+            durationToleranceInSeconds = self.matchDurationToleranceInSeconds
+
+        candidateTrigrams = dict()
+
+        def getTrigrams(track: Track) -> tuple:
+            if track.id not in candidateTrigrams:
+                candidateTrigrams[track.id] = (
+                    trigrams(normalizeTrackText(track.title)),
+                    trigrams(normalizeTrackText(track.fullTitle)),
+                    trigrams(normalizeTrackText(track.artist)),
+                )
+
+            return candidateTrigrams[track.id]
+
+        queryTrigrams = [
+            (trigrams(normalizeTrackText(title)), trigrams(normalizeTrackText(artist)) if normalizeTrackText(artist) else None)
+            for artist, title in zip(artists, titles)
+        ]
+
+        def score(index: int, track: Track) -> float:
+            titleTrigrams, artistTrigrams = queryTrigrams[index]
+            trackTitleTrigrams, trackFullTitleTrigrams, trackArtistTrigrams = getTrigrams(track)
+
+            titleScore = max(similarity(titleTrigrams, trackTitleTrigrams), similarity(titleTrigrams, trackFullTitleTrigrams))
+
+            if artistTrigrams is None:
+                result = titleScore
+
+            else:
+                result = 0.65 * titleScore + 0.35 * similarity(artistTrigrams, trackArtistTrigrams)
+
+            duration = durations[index]
+
+            if duration and track.duration:
+                if abs(track.duration - duration) <= durationToleranceInSeconds:
+                    result = min(1.0, result + 0.05)
+
+                else:
+                    result *= 0.5
+
+            return result
+
+        def pickBest(index: int, candidates: Union[List[Track], None]) -> Union[Track, None]:
+            best, bestScore = None, minScore
+
+            for track in candidates or list():
+                if not isinstance(track, Track):
+                    continue
+
+                trackScore = score(index, track)
+
+                if trackScore > bestScore:
+                    best, bestScore = track, trackScore
+
+            return best
+
+        results = [None] * len(titles)
+
+        for useArtist in (True, False):
+            indexes = [
+                index
+                for index, (artist, title) in enumerate(zip(artists, titles))
+                if results[index] is None and cleanTrackText(title) and (cleanTrackText(artist) or useArtist)
+            ]
+
+            if not indexes:
+                break
+
+            queries = [
+                f"{cleanTrackText(artists[index])} {cleanTrackText(titles[index])}".strip() if useArtist else cleanTrackText(titles[index])
+                for index in indexes
+            ]
+
+            candidates = await self.searchMany(
+                queries,
+                Track,
+                limit,
+                concurrency,
+            )
+
+            for index, indexCandidates in zip(indexes, candidates):
+                results[index] = pickBest(index, indexCandidates)
+
+        return results
+
+    match_tracks = matchTracks
\ No newline at end of file
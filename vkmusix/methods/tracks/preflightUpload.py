@@ -0,0 +1,209 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class PreflightUpload:
+    from typing import Union, List
+
+    from vkmusix.aio import async_
+    from vkmusix.types import LocalTrack
+
+    fingerprintWindowSizeInBytes = 16 * 1024
+    fingerprintPositions = (0.1, 0.3, 0.5, 0.7, 0.9)
+    durationToleranceInSeconds = 2
+
+    @async_
+    async def preflightUpload(self, filenames: Union[List[str], str], ownerId: int = None, concurrency: int = 4) -> Union[List[Union[LocalTrack, None]], LocalTrack]:
+        """
+        Проверяет .MP3 файлы перед загрузкой, не отправляя их во ВКонтакте: читает метаданные и длительность, считает хеш содержимого и отпечаток аудиоданных, а также ищет совпадающие треки в музыке owner'а (по названию, артистам и длительности) и одинаковые файлы внутри списка.
+
+        `Пример использования`:
+
+        localTracks = client.preflightUpload(
+            filenames=[
+                "Маленький ярче — LARILARI",
+                "Маленький ярче — ANDERFUL ELF",
+            ],
+        )
+
+        for localTrack in localTracks:
+            print(localTrack.filename, localTrack.duplicate or localTrack.sameAs)
+
+        :param filenames: пути к .MP3 (обязательно) файлам. (``Union[list[str], str]``)
+        :param ownerId: идентификатор owner'а (пользователь или группа), в музыке которого необходимо искать совпадения. По умолчанию залогиненный пользователь. (``int``, `optional`)
+        :param concurrency: максимальное количество одновременно читаемых файлов. По умолчанию ``4``. (``int``, `optional`)
+        :return: `Если файлов несколько`: информация о файлах (``list[types.LocalTrack]``), ``None`` на месте не найденных файлов. `Если файл один`: информация о файле (``types.LocalTrack``).
+        """
+
+        import hashlib
+        import os
+        from asyncio import get_event_loop
+        from typing import Union
+
+        from mutagen import MutagenError
+        from mutagen.mp3 import MP3
+
+        from vkmusix.errors import Error
+        from vkmusix.types import LocalTrack
+        from vkmusix.utils import gatherWithConcurrency, normalizeText
+
+        wasList = isinstance(filenames, list)
+
+        if not wasList:
+            filenames = [filenames]
+
+        chunkSize = self.chunkSize
+        fingerprintWindowSizeInBytes = self.fingerprintWindowSizeInBytes
+        fingerprintPositions = self.fingerprintPositions
+
+        def readLocalTrack(filename: str) -> dict:
+            sizeInBytes = os.path.getsize(filename)
+            contentHash = hashlib.sha256()
+            fingerprint = hashlib.sha1()
+
+            with open(filename, "rb") as file:
+                header = file.read(10)
+                audioStart = 0
+
+                if len(header) == 10 and header[:3] == b"ID3":
+                    audioStart = 10 + (
+                        (header[6] & 0x7F) << 21 |
+                        (header[7] & 0x7F) << 14 |
+                        (header[8] & 0x7F) << 7 |
+                        (header[9] & 0x7F)
+                    )
+
+                    if header[5] & 0x10:
+                        audioStart += 10
+
+                audioEnd = sizeInBytes
+
+                if sizeInBytes >= 128:
+                    file.seek(sizeInBytes - 128)
+
+                    if file.read(3) == b"TAG":
+                        audioEnd -= 128
+
+                audioSizeInBytes = max(audioEnd - audioStart, 0)
+
+                for position in fingerprintPositions:
+                    offset = audioStart + int(audioSizeInBytes * position)
+                    file.seek(offset)
+                    fingerprint.update(file.read(min(fingerprintWindowSizeInBytes, audioEnd - offset)))
+
+                file.seek(0)
+
+                for chunk in iter(lambda: file.read(chunkSize), b""):
+                    contentHash.update(chunk)
+
+            title, artist, duration, bitrate = None, None, None, None
+
+            try:
+                audio = MP3(filename)
+
+                duration = round(audio.info.length) if audio.info.length else None
+                bitrate = audio.info.bitrate // 1000 if audio.info.bitrate else None
+
+                if audio.tags:
+                    if audio.tags.get("TIT2"):
+                        title = ", ".join(audio.tags.get("TIT2").text)
+
+                    if audio.tags.get("TPE1"):
+                        artist = ", ".join(audio.tags.get("TPE1").text)
+
+            except MutagenError:
+                pass
+
+            if not title or not artist:
+                name = os.path.splitext(os.path.basename(filename))[0]
+
+                for separator in (" — ", " – ", " - "):
+                    if separator in name:
+                        artistFromName, titleFromName = name.split(separator, 1)
+
+                        title = title or titleFromName.strip()
+                        artist = artist or artistFromName.strip()
+                        break
+
+                else:
+                    title = title or name
+
+            return {
+                "filename": filename,
+                "title": title,
+                "artist": artist,
+                "duration": duration,
+                "bitrate": bitrate,
+                "size_in_bytes": sizeInBytes,
+                "hash": contentHash.hexdigest(),
+                "fingerprint": fingerprint.hexdigest() if audioSizeInBytes else None,
+            }
+
+        async def preflightOne(filename: str) -> Union[dict, None]:
+            try:
+                filename, _ = self._prepareUploadFile(filename, None)
+
+            except Error:
+                if not wasList:
+                    raise
+
+                return
+
+            return await get_event_loop().run_in_executor(None, readLocalTrack, filename)
+
+        localTracks, libraryTracks = await gatherWithConcurrency(
+            (
+                gatherWithConcurrency((preflightOne(filename) for filename in filenames), concurrency),
+                self._getLibraryTracks(ownerId),
+            ),
+        )
+
+        index = dict()
+
+        for track in libraryTracks or list():
+            for title in {normalizeText(track.title), normalizeText(track.fullTitle)}:
+                index.setdefault((title, normalizeText(track.artist)), list()).append(track)
+
+        seen = dict()
+
+        for idx, localTrack in enumerate(localTracks):
+            if not localTrack:
+                continue
+
+            for track in index.get((normalizeText(localTrack["title"]), normalizeText(localTrack["artist"])), list()):
+                if (
+                    not localTrack["duration"] or
+                    not track.duration or
+                    abs(track.duration - localTrack["duration"]) <= self.durationToleranceInSeconds
+                ):
+                    localTrack["duplicate"] = track
+                    break
+
+            for key in (localTrack["hash"], localTrack["fingerprint"]):
+                if key and key in seen:
+                    localTrack["same_as"] = seen[key]
+                    break
+
+            for key in (localTrack["hash"], localTrack["fingerprint"]):
+                if key:
+                    seen.setdefault(key, localTrack["filename"])
+
+            localTracks[idx] = LocalTrack(localTrack)
+
+        return localTracks if wasList else localTracks[0]
+
+    preflight_upload = preflightUpload
\ No newline at end of file
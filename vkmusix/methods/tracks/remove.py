@@ -22,7 +22,7 @@ class Remove:
     from vkmusix.aio import async_
 
     @async_
-    async def remove(self, ownerIds: Union[List[int], int], trackIds: Union[List[int], int], playlistId: int = None, groupId: int = None, validateIds: bool = True) -> Union[List[bool], bool]:
+    async def remove(self, ownerIds: Union[List[int], int], trackIds: Union[List[int], int], playlistId: int = None, groupId: int = None, validateIds: bool = True, concurrency: int = 4) -> Union[List[bool], bool]:
         """
         Удаляет треки из музыки или плейлиста пользователя или группы.
 
@@ -40,14 +40,13 @@ class Remove:
         :param playlistId: идентификатор плейлиста, из которого необходимо удалить треки. Метод не работает для плейлистов, привязанных к чату. (``int``, `optional`)
         :param groupId: идентификатор группы, из музыки или плейлиста которой необходимо удалить треки. (``int``, `optional`)
         :param validateIds: флаг, указывающий, необходимо ли перепроверить треки на наличие в музыке или плейлисте. По умолчанию ``True``. Установите на ``False``, если вы получили треки через ``client.getTracks()`` или ``client.getSection()`` (при удалении из музыки) или ``client.getPlaylistTracks()`` (при удалении из плейлиста). (``bool``, `optional`)
+        :param concurrency: максимальное количество одновременных запросов. Треки из музыки удаляются по одному, из плейлиста — частями по 100. По умолчанию ``4``. (``int``, `optional`)
         :return: `Если треков несколько`: статусы удаления треков (``list[bool]``). `Если трек один`: статус удаления трека (``bool``). `При успехе`: ``True``. `Если трек не удалось удалить`: ``False``.
         """
 
-        import asyncio
-
-        from itertools import islice
-
         from vkmusix.errors import AccessDenied
+        from vkmusix.types import Track
+        from vkmusix.utils import chunks, gatherWithConcurrency, normalizeText
 
         if type(ownerIds) != type(trackIds):
             self._raiseError("ownerIdsAndTrackIdsTypeDifferent")
@@ -66,73 +65,51 @@ class Remove:
 
         if validateIds:
             if playlistId:
-                existTracks = await self.getPlaylistTracks(
+                # Проверка сравнивает названия, поэтому нужны все треки плейлиста с полной информацией, а не только последние 1000
+                existTracksCoroutine = self.getPlaylistTracks(
                     playlistId,
                     groupId,
+                    None,
+                    True,
                 )
 
-                if not existTracks:
-                    return [False] * len(ownerIds)
-
             else:
-                sections = await self.getSections(
+                existTracksCoroutine = self._getLibraryTracks(
                     groupId,
                 )
 
-                if not sections:
-                    return [False] * len(ownerIds)
-
-                subsections = (await sections[0].get()).subsections
+            existTracks, tracks = await gatherWithConcurrency(
+                (
+                    existTracksCoroutine,
+                    self.getMany(ownerIds, trackIds),
+                ),
+            )
 
-                existTracks = await subsections[0].getTracks()
+            if not existTracks:
+                return [False] * len(ownerIds) if wasList else False
 
-                if not existTracks:
-                    return [False] * len(ownerIds)
-
-                existOwnerIds = [track.ownerId for track in existTracks]
-                existTrackIds = [track.trackId for track in existTracks]
-
-                batchSize = 343
-                tasks = [
-                    self.get(
-                        existOwnerIds[i:i + batchSize],
-                        existTrackIds[i:i + batchSize]
-                    )
-                    for i in range(0, len(existTracks), batchSize)
-                ]
+            def trackKey(track: Track) -> tuple:
+                artists = ", ".join(artist.nickname for artist in track.artists if artist.nickname) if track.artists else None
 
-                batches = await asyncio.gather(*tasks)
+                return normalizeText(track.fullTitle), normalizeText(artists or track.artist)
 
-                existTracks = [
-                    track
-                    for batch in batches if batch
-                    for track in batch
-                ]
+            index = dict()
 
-            for idx, (ownerId, trackId) in enumerate(zip(ownerIds, trackIds)):
-                track = await self.get(ownerId, trackId)
+            for existTrack in existTracks:
+                index.setdefault(trackKey(existTrack), existTrack)
 
-                trackFullTitle = track.fullTitle
-                trackArtists = str(track.artists) or track.artist
+            for idx, track in enumerate(tracks):
+                if not track:
+                    continue
 
-                for existTrack in existTracks:
-                    existTrackFullTitle = existTrack.fullTitle
-                    existTrackArtists = str(existTrack.artists) or existTrack.artist
+                existTrack = index.get(trackKey(track))
 
-                    if existTrackFullTitle == trackFullTitle and existTrackArtists == trackArtists:
-                        ownerIds[idx] = existTrack.ownerId
-                        trackIds[idx] = existTrack.trackId
-                        break
-
-        results = list()
+                if existTrack:
+                    ownerIds[idx] = existTrack.ownerId
+                    trackIds[idx] = existTrack.trackId
 
         if playlistId:
-            def chunks(iterable):
-                iterator = iter(iterable)
-                for first in iterator:
-                    yield [first] + list(islice(iterator, 99))
-
-            for trackChunk in chunks(zip(ownerIds, trackIds)):
+            async def removeChunk(trackChunk: list) -> list:
                 ids = ",".join(
                     f"{ownerId}_{trackId}"
                     for ownerId, trackId in trackChunk
@@ -148,13 +125,24 @@ class Remove:
                         },
                     )
 
-                    results.append([bool(response)] * len(trackChunk))
+                    return [bool(response)] * len(trackChunk)
 
                 except AccessDenied:
-                    results.extend([False] * len(trackChunk))
+                    return [False] * len(trackChunk)
+
+            chunksResults = await gatherWithConcurrency(
+                (removeChunk(trackChunk) for trackChunk in chunks(zip(ownerIds, trackIds), 100)),
+                concurrency,
+            )
+
+            results = [
+                result
+                for chunkResults in chunksResults
+                for result in chunkResults
+            ]
 
         else:
-            for ownerId, trackId in zip(ownerIds, trackIds):
+            async def removeOne(ownerId: int, trackId: int) -> bool:
                 try:
                     response = await self._req(
                         "delete",
@@ -164,9 +152,15 @@ class Remove:
                             "group_id": groupId,
                         },
                     )
-                    results.append(bool(response))
+
+                    return bool(response)
 
                 except AccessDenied:
-                    results.append(False)
+                    return False
+
+            results = await gatherWithConcurrency(
+                (removeOne(ownerId, trackId) for ownerId, trackId in zip(ownerIds, trackIds)),
+                concurrency,
+            )
 
         return results if wasList else results[0]
\ No newline at end of file
@@ -17,13 +17,14 @@
 #  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
 
 class Upload:
-    from typing import Union
+    from typing import Union, AsyncIterable, BinaryIO
 
     from vkmusix.aio import async_
     from vkmusix.types import Track
+    from vkmusix.enums import Priority
 
     @async_
-    async def upload(self, filename: str, title: str = None, artist: str = None, lyrics: str = None, genreId: int = None, removeFromSearchResults: bool = None, playlistId: int = None, groupId: int = None) -> Union[Track, None]:
+    async def upload(self, filename: str = None, title: str = None, artist: str = None, lyrics: str = None, genreId: int = None, removeFromSearchResults: bool = None, playlistId: int = None, groupId: int = None, priority: Priority = None, file: Union[BinaryIO, AsyncIterable[bytes]] = None, progress: callable = None, skipDuplicates: bool = False) -> Union[Track, None]:
         """
         Загружает новый трек во ВКонтакте.
 
@@ -39,7 +40,17 @@ class Upload:
 
         print(track)
 
-        :param filename: путь к .MP3 (обязательно) файлу. (``str``)
+        `Пример использования для загрузки из файлового объекта или асинхронного итератора байтов с отображением прогресса`:
+
+        with open("Маленький ярче — LARILARI.mp3", "rb") as file:
+            track = client.upload(
+                file=file,
+                progress=lambda uploaded, total: print(uploaded, total),
+            )
+
+        print(track)
+
+        :param filename: путь к .MP3 (обязательно) файлу. Если указан параметр ``file``, используется только как имя файла при отправке. (``str``)
         :param title: название трека. По умолчанию берётся из метаданных файла. (``str``, `optional`)
         :param artist: артисты трека. По умолчанию берётся из метаданных файла. (``str``, `optional`)
         :param lyrics: текст трека. (``str``, `optional`)
@@ -47,46 +58,38 @@ class Upload:
         :param removeFromSearchResults: флаг, указывающий, необходимо ли исключить трек из поиска. По умолчанию ``False``. (``bool``, `optional`)
         :param playlistId: идентификатор плейлиста, в который необходимо добавить трек после загрузки. (``int``, `optional`)
         :param groupId: идентификатор группы, в плейлист или музыку которой необходимо добавить трек после загрузки. (``int``, `optional`)
-        :return: `При успехе`: информация о загруженном треке (``types.Track``). `Если трек не удалось загрузить`: ``None``.
+        :param priority: приоритет отправки файла при ограничении скорости через ``uploadLimit``. По умолчанию ``Priority.Normal``. (``enums.Priority``, `optional`)
+        :param file: файловый объект, открытый в бинарном режиме (обычный или асинхронный), или асинхронный итератор байтов с содержимым .MP3 файла. Позволяет загрузить трек без временного файла на диске. (``Union[BinaryIO, AsyncIterable[bytes]]``, `optional`)
+        :param progress: функция, вызываемая после отправки каждой части файла с аргументами ``(uploaded, total)`` — количество отправленных байтов и размер файла в байтах (``None``, если размер неизвестен). Может быть асинхронной. (``callable``, `optional`)
+        :param skipDuplicates: флаг, указывающий, необходимо ли перед отправкой проверить файл через ``client.preflightUpload()`` и не загружать его, если такой трек уже есть в музыке пользователя или группы ``groupId``. По умолчанию ``False``. Игнорируется, если указан параметр ``file``. (``bool``, `optional`)
+        :return: `При успехе`: информация о загруженном треке (``types.Track``). `Если трек уже есть в музыке и указан skipDuplicates`: информация о найденном треке (``types.Track``). `Если трек не удалось загрузить`: ``None``.
         """
 
-        import os.path
-        import aiofiles
-
-        from vkmusix import web
         from vkmusix.types import Track
-        from vkmusix.utils import checkFile
+        from vkmusix.enums import Priority
 
-        if filename.endswith(".mp3"):
-            filename = filename[:-4]
+        filename, fileSizeInBytes = self._prepareUploadFile(filename, file)
 
-        filename = checkFile(f"{filename}.mp3")
-        if not filename:
-            self._raiseError("MP3FileNotFound")
+        if skipDuplicates and file is None:
+            localTrack = await self.preflightUpload(filename, groupId)
 
-        fileSizeInBytes = os.path.getsize(filename)
-        fileSizeInMB = fileSizeInBytes / (1024 * 1024)
-
-        if fileSizeInMB > 200:
-            self._raiseError("MP3FileTooBig")
+            if localTrack.duplicate:
+                return localTrack.duplicate
 
         uploadUrl = (await self._req("getUploadServer")).get("upload_url")
 
-        async with aiofiles.open(filename, "rb") as file:
-            fileContent = await file.read()
-
-        uploadingFileResponse = await self._client(
+        uploadingFileResponse = await self._uploadFile(
             uploadUrl,
-            files={
-                "file": (
-                    filename,
-                    fileContent,
-                    "audio/mpeg",
-                ),
-            },
-            method=web.Method.POST,
+            filename,
+            file,
+            fileSizeInBytes,
+            priority if priority and isinstance(priority, Priority) else Priority.Normal,
+            progress,
         )
 
+        if not uploadingFileResponse:
+            return
+
         server = uploadingFileResponse.get("server")
         audio = uploadingFileResponse.get("audio")
         hash = uploadingFileResponse.get("hash")
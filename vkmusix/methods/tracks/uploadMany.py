@@ -0,0 +1,299 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+class UploadMany:
+    from typing import Union, List
+
+    from vkmusix.aio import async_
+    from vkmusix.types import Track
+    from vkmusix.enums import Priority
+
+    @async_
+    async def uploadMany(self, filenames: List[str], lyrics: str = None, genreId: int = None, removeFromSearchResults: bool = None, playlistId: int = None, groupId: int = None, concurrency: int = 4, priority: Priority = None, stateFile: str = None, progress: callable = None, skipDuplicates: bool = False) -> List[Union[Track, None]]:
+        """
+        Загружает несколько новых треков во ВКонтакте. Файлы отправляются параллельно, ссылка на сервер загрузки используется повторно, пока она действительна, а изменение информации, добавление в плейлист или музыку группы и удаление исходных треков выполняются пакетно после завершения всех загрузок.
+
+        `Пример использования`:
+
+        tracks = client.uploadMany(
+            filenames=[
+                "Маленький ярче — LARILARI",
+                "Маленький ярче — ANDERFUL ELF",
+            ],
+            genreId=21,
+            concurrency=4,
+            stateFile="upload.json",
+        )
+
+        print(tracks)
+
+        :param filenames: пути к .MP3 (обязательно) файлам. (``list[str]``)
+        :param lyrics: текст, который необходимо установить всем трекам. (``str``, `optional`)
+        :param genreId: идентификатор жанра треков. (``int``, `optional`)
+        :param removeFromSearchResults: флаг, указывающий, необходимо ли исключить треки из поиска. По умолчанию ``False``. (``bool``, `optional`)
+        :param playlistId: идентификатор плейлиста, в который необходимо добавить треки после загрузки. (``int``, `optional`)
+        :param groupId: идентификатор группы, в плейлист или музыку которой необходимо добавить треки после загрузки. (``int``, `optional`)
+        :param concurrency: максимальное количество одновременно отправляемых файлов и запросов при последующей обработке. По умолчанию ``4``. (``int``, `optional`)
+        :param priority: приоритет отправки файлов при ограничении скорости через ``uploadLimit``. По умолчанию ``Priority.Normal``. (``enums.Priority``, `optional`)
+        :param stateFile: путь к JSON-файлу, в котором сохраняется прогресс. При повторном запуске с тем же файлом уже загруженные треки не отправляются заново, а незавершённая обработка продолжается. (``str``, `optional`)
+        :param progress: функция, вызываемая после загрузки каждого файла с аргументами ``(uploaded, total)`` — количество загруженных файлов и их общее количество. Может быть асинхронной. (``callable``, `optional`)
+        :param skipDuplicates: флаг, указывающий, необходимо ли перед отправкой проверить файлы через ``client.preflightUpload()``: файлы, которые уже есть в музыке пользователя или группы ``groupId``, не загружаются, а одинаковые файлы внутри списка загружаются один раз. По умолчанию ``False``. (``bool``, `optional`)
+        :return: Результаты в порядке ``filenames``: информация о загруженном треке (``types.Track``), о найденном в музыке треке, если указан ``skipDuplicates``, или ``None``, если файл не удалось загрузить (``list[Union[types.Track, None]]``). Трек считается обработанным (и не обрабатывается повторно при запуске с тем же ``stateFile``), только если изменение информации, добавление и удаление исходного трека прошли успешно. Если при загрузке возникло непредвиденное исключение, оно выбрасывается после обработки остальных файлов и сохранения прогресса.
+        """
+
+        import asyncio
+        import json
+        import os
+        from inspect import isawaitable
+        from typing import Union
+
+        import aiofiles
+        import aiofiles.os
+
+        from vkmusix.errors import Error
+        from vkmusix.types import Track
+        from vkmusix.enums import Priority
+        from vkmusix.utils import gatherWithConcurrency
+
+        if not isinstance(filenames, list):
+            filenames = [filenames]
+
+        if not priority or not isinstance(priority, Priority):
+            priority = Priority.Normal
+
+        state = dict()
+
+        if stateFile and os.path.isfile(stateFile):
+            async with aiofiles.open(stateFile, "r", encoding="utf-8") as file:
+                state = json.loads(await file.read() or "{}")
+
+        stateLock = asyncio.Lock()
+
+        async def saveState() -> None:
+            if not stateFile:
+                return
+
+            async with stateLock:
+                async with aiofiles.open(f"{stateFile}.tmp", "w", encoding="utf-8") as file:
+                    await file.write(json.dumps(state, ensure_ascii=False, indent=4))
+
+                await aiofiles.os.replace(f"{stateFile}.tmp", stateFile)
+
+        uploadUrlLock = asyncio.Lock()
+        uploadUrls = [None]
+
+        async def getUploadUrl(expiredUploadUrl: str = None) -> str:
+            async with uploadUrlLock:
+                if not uploadUrls[0] or uploadUrls[0] == expiredUploadUrl:
+                    uploadUrls[0] = (await self._req("getUploadServer")).get("upload_url")
+
+                return uploadUrls[0]
+
+        uploadedCount = [0]
+
+        async def uploadOne(filename: str) -> Union[str, None]:
+            key = os.path.abspath(filename)
+
+            if key in state:
+                return state[key].get("id")
+
+            try:
+                filename, fileSizeInBytes = self._prepareUploadFile(filename, None)
+
+            except Error:
+                return
+
+            uploadingFileResponse = None
+
+            for _ in range(2):
+                uploadUrl = await getUploadUrl()
+                uploadingFileResponse = await self._uploadFile(uploadUrl, filename, None, fileSizeInBytes, priority, None)
+
+                if uploadingFileResponse:
+                    break
+
+                await getUploadUrl(uploadUrl)
+
+            if not uploadingFileResponse:
+                return
+
+            track = await self._req(
+                "save",
+                {
+                    "server": uploadingFileResponse.get("server"),
+                    "audio": uploadingFileResponse.get("audio"),
+                    "hash": uploadingFileResponse.get("hash"),
+                },
+            )
+
+            if not track or not isinstance(track, dict) or track.get("error_code"):
+                return
+
+            state[key] = {
+                "id": f"{track.get('owner_id')}_{track.get('id')}",
+                "processed": False,
+            }
+            await saveState()
+
+            uploadedCount[0] += 1
+
+            if progress:
+                result = progress(uploadedCount[0], len(filenames) - len(duplicates))
+
+                if isawaitable(result):
+                    await result
+
+            return state[key].get("id")
+
+        duplicates = dict()
+
+        if skipDuplicates:
+            localTracks = await self.preflightUpload(filenames, groupId, concurrency)
+            firstIndexes = dict()
+
+            for idx, (filename, localTrack) in enumerate(zip(filenames, localTracks)):
+                if not localTrack:
+                    continue
+
+                firstIndexes.setdefault(localTrack.filename, idx)
+
+                if os.path.abspath(filename) in state:
+                    continue
+
+                if localTrack.duplicate:
+                    duplicates[idx] = localTrack.duplicate
+
+                elif localTrack.sameAs:
+                    duplicates[idx] = firstIndexes.get(localTrack.sameAs)
+
+        async def skip() -> None:
+            return
+
+        ids = await gatherWithConcurrency(
+            (
+                uploadOne(filename) if idx not in duplicates else skip()
+                for idx, filename in enumerate(filenames)
+            ),
+            concurrency,
+            True,
+        )
+        uploadErrors = [id for id in ids if isinstance(id, BaseException)]
+        ids = [id if isinstance(id, str) else None for id in ids]
+
+        uniqueIds = list(dict.fromkeys(id for id in ids if id))
+        pendingIds = list(dict.fromkeys(
+            state[os.path.abspath(filename)].get("id")
+            for filename, id in zip(filenames, ids)
+            if id and not state[os.path.abspath(filename)].get("processed")
+        ))
+
+        processedIds = {id: True for id in pendingIds}
+        idsKeys = dict()
+
+        for filename, id in zip(filenames, ids):
+            if id:
+                idsKeys.setdefault(id, list()).append(os.path.abspath(filename))
+
+        if pendingIds and any((lyrics, genreId, removeFromSearchResults)):
+            editResults = await gatherWithConcurrency(
+                (
+                    self.edit(int(id.split("_")[0]), int(id.split("_")[1]), lyrics=lyrics, genreId=genreId, removeFromSearchResults=removeFromSearchResults)
+                    for id in pendingIds
+                ),
+                concurrency,
+                True,
+            )
+
+            for id, result in zip(pendingIds, editResults):
+                if result is not True:
+                    processedIds[id] = False
+
+        tracks = {
+            track.id: track
+            for track in await self.getMany(
+                [int(id.split("_")[0]) for id in uniqueIds],
+                [int(id.split("_")[1]) for id in uniqueIds],
+                concurrency=concurrency,
+            ) if track
+        }
+
+        if pendingIds and any((playlistId, groupId)):
+            idsToAdd = [id for id in pendingIds if not state[idsKeys[id][0]].get("added")]
+
+            if idsToAdd:
+                addResults = await self.add(
+                    [int(id.split("_")[0]) for id in idsToAdd],
+                    [int(id.split("_")[1]) for id in idsToAdd],
+                    playlistId,
+                    groupId,
+                )
+
+                for id, result in zip(idsToAdd, addResults):
+                    if not result:
+                        processedIds[id] = False
+                        continue
+
+                    for key in idsKeys[id]:
+                        state[key]["added"] = True
+
+                await saveState()
+
+            # Исходный трек удаляется только если копия уже есть в плейлисте или музыке группы
+            addedIds = [id for id in pendingIds if state[idsKeys[id][0]].get("added")]
+
+            if addedIds:
+                removeResults = await self.remove(
+                    [int(id.split("_")[0]) for id in addedIds],
+                    [int(id.split("_")[1]) for id in addedIds],
+                    validateIds=False,
+                )
+
+                for id, result in zip(addedIds, removeResults):
+                    if not result:
+                        processedIds[id] = False
+
+        if pendingIds:
+            for id in pendingIds:
+                if processedIds[id]:
+                    for key in idsKeys[id]:
+                        state[key]["processed"] = True
+
+            await saveState()
+
+        if uploadErrors:
+            raise uploadErrors[0]
+
+        results = [
+            (
+                tracks.get(id) or self._finalizeResponse(
+                    {
+                        "owner_id": int(id.split("_")[0]),
+                        "track_id": int(id.split("_")[1]),
+                    },
+                    Track,
+                )
+            ) if id else None
+            for id in ids
+        ]
+
+        for idx, duplicate in duplicates.items():
+            results[idx] = results[duplicate] if isinstance(duplicate, int) else duplicate
+
+        return results
+
+    upload_many = uploadMany
\ No newline at end of file
@@ -0,0 +1,143 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Union, List, Tuple, Callable, Awaitable, AsyncIterator, Iterator
+import asyncio
+
+class Paginator:
+    """
+    Ленивый итератор по результатам, которые ВКонтакте отдаёт постранично. Поддерживает как ``for``, так и ``async for``: следующая страница запрашивается, пока обрабатывается текущая, а в памяти одновременно находится не более двух страниц.
+
+    `Пример использования`:
+
+    for track in client.iterSearchTracks("Маленький ярче", limit=1000):
+        print(track)
+
+    async for track in client.iterSearchTracks("Маленький ярче", limit=1000):
+        print(track)
+    """
+
+    def __init__(self, client: "Client", fetchPage: Callable[[Union[int, str, None], int], Awaitable[Tuple[Union[List[any], None], Union[int, str, None]]]], limit: int = None, pageSize: int = 100, offset: Union[int, str] = None) -> None:
+        self._client = client
+        self._fetchPage = fetchPage
+
+        self.limit = limit if limit and limit > 0 else None
+        self.pageSize = pageSize
+        self.offset = offset
+
+
+    @classmethod
+    def fromMethod(cls, client: "Client", getPage: Callable[[int, Union[int, None]], Awaitable[Union[List[any], None]]], limit: int = None, pageSize: int = 100, offset: int = None, transform: Callable[[List[any]], List[any]] = None) -> "Paginator":
+        """
+        Создаёт итератор по методу, принимающему количество и смещение. Следующее смещение вычисляется по количеству полученных объектов, а пустая страница завершает итерацию.
+
+        :param client: клиент. (``Client``)
+        :param getPage: функция, получающая страницу по ``(count, offset)``. (``callable``)
+        :param limit: максимальное количество объектов. По умолчанию без ограничения. (``int``, `optional`)
+        :param pageSize: количество объектов, получаемых за один запрос. По умолчанию ``100``. (``int``, `optional`)
+        :param offset: сколько объектов пропустить. (``int``, `optional`)
+        :param transform: функция, применяемая к каждой странице после вычисления следующего смещения (например, фильтр). (``callable``, `optional`)
+        :return: итератор, поддерживающий ``for`` и ``async for`` (``Paginator``).
+        """
+
+        async def fetchPage(offset: Union[int, None], count: int) -> Tuple[Union[List[any], None], Union[int, None]]:
+            items = await getPage(count, offset)
+
+            if not items:
+                return None, None
+
+            nextOffset = (offset or 0) + len(items)
+
+            return transform(items) if transform else items, nextOffset
+
+        return cls(client, fetchPage, limit, pageSize, offset)
+
+
+    def _count(self, fetched: int) -> int:
+        if not self.limit:
+            return self.pageSize
+
+        return min(self.pageSize, self.limit - fetched)
+
+
+    async def pages(self) -> AsyncIterator[List[any]]:
+        fetched = 0
+        task = asyncio.ensure_future(self._fetchPage(self.offset, self._count(fetched)))
+
+        try:
+            while task:
+                items, offset = await task
+                task = None
+
+                items = list(items or list())
+
+                if self.limit:
+                    items = items[:self.limit - fetched]
+
+                fetched += len(items)
+
+                if offset is not None and (not self.limit or fetched < self.limit):
+                    task = asyncio.ensure_future(self._fetchPage(offset, self._count(fetched)))
+
+                if items:
+                    yield items
+
+        finally:
+            if task:
+                task.cancel()
+
+
+    async def _iterate(self) -> AsyncIterator[any]:
+        async for items in self.pages():
+            for item in items:
+                yield item
+
+
+    def __aiter__(self) -> AsyncIterator[any]:
+        return self._iterate()
+
+
+    def __iter__(self) -> Iterator[any]:
+        from asyncio import get_running_loop, run_coroutine_threadsafe
+
+        from vkmusix.aio import getLoopThread
+
+        try:
+            get_running_loop()
+
+        except RuntimeError:
+            pass
+
+        else:
+            self._client._raiseError("syncIterationInsideEventLoop")
+
+        loop = getLoopThread(self._client).getLoop()
+        pages = self.pages()
+
+        try:
+            while True:
+                try:
+                    items = run_coroutine_threadsafe(pages.__anext__(), loop).result()
+
+                except StopAsyncIteration:
+                    return
+
+                yield from items
+
+        finally:
+            run_coroutine_threadsafe(pages.aclose(), loop).result()
\ No newline at end of file
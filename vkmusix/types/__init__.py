@@ -21,6 +21,7 @@ from .album import Album
 from .track import Track
 from .playlist import Playlist
 from .genre import Genre
+from .localTrack import LocalTrack
 
 from .section import Section
 from .message import Message
@@ -0,0 +1,79 @@
+#  VKMusix — VK Music API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/VKMusix>
+#
+#  This file is part of VKMusix.
+#
+#  VKMusix is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  VKMusix is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
+
+from .base import Base
+
+class LocalTrack(Base):
+    """
+    Класс, представляющий локальный .MP3 файл, подготовленный к загрузке.
+
+    Атрибуты:
+        filename (str): путь к файлу.
+
+        title (str, optional): название трека из метаданных файла, а при их отсутствии — из имени файла.
+
+        artist (str, optional): артисты трека из метаданных файла, а при их отсутствии — из имени файла.
+
+        duration (int, optional): длительность трека в секундах.
+
+        bitrate (int, optional): битрейт трека в кбит/с.
+
+        sizeInBytes (int): размер файла в байтах.
+
+        hash (str): SHA-256 хеш содержимого файла.
+
+        fingerprint (str, optional): отпечаток аудиоданных без учёта метаданных. Совпадает у копий одной записи с разными тегами.
+
+        duplicate (types.Track, optional): трек из музыки owner'а, совпадающий с файлом по названию, артистам и длительности.
+
+        sameAs (str, optional): путь к предыдущему файлу из того же списка с тем же содержимым или отпечатком.
+    """
+
+    __slots__ = (
+        'filename',
+        'title',
+        'artist',
+        'duration',
+        'bitrate',
+        'sizeInBytes',
+        'hash',
+        'fingerprint',
+        'duplicate',
+        'sameAs',
+    )
+
+    def __init__(self, localTrack: dict) -> None:
+        self.filename = localTrack.get("filename")
+
+        self.title = localTrack.get("title")
+
+        self.artist = localTrack.get("artist")
+
+        self.duration = localTrack.get("duration")
+
+        self.bitrate = localTrack.get("bitrate")
+
+        self.sizeInBytes = localTrack.get("size_in_bytes")
+
+        self.hash = localTrack.get("hash")
+
+        self.fingerprint = localTrack.get("fingerprint")
+
+        self.duplicate = localTrack.get("duplicate")
+
+        self.sameAs = localTrack.get("same_as")
\ No newline at end of file
@@ -136,7 +136,7 @@ class Section(Base):
 
 
     @async_
-    async def get(self, offset: str = None) -> "Section":
+    async def get(self, offset: str = None, hydrate: bool = False) -> "Section":
         """
         Получает информацию о разделе музыки.
 
@@ -147,17 +147,19 @@ class Section(Base):
         print(section)
 
         :param offset: уникальное значение, содержащееся в атрибуте ``nextOffset`` объекта класса ``types.Section``. Необходимо для получения следующих результатов в разделе. (``str``, `optional`)
+        :param hydrate: флаг, указывающий, необходимо ли сразу получить полную информацию о треках через ``client.hydrate()``. По умолчанию ``False``. (``bool``, `optional`)
         :return: `При успехе`: информация о разделе музыки (``types.Section``). `Если раздел не найден`: ``None``.
         """
 
         return await self._client.getSection(
             self.id,
             offset,
+            hydrate,
         )
 
 
     @async_
-    async def getTracks(self) -> Union[List[Track], None]:
+    async def getTracks(self, hydrate: bool = False) -> Union[List[Track], None]:
         """
         Получает треки из раздела музыки.
 
@@ -167,11 +169,13 @@ class Section(Base):
 
         print(tracks)
 
+        :param hydrate: флаг, указывающий, необходимо ли сразу получить полную информацию о треках через ``client.hydrate()``. По умолчанию ``False``. (``bool``, `optional`)
         :return: `При успехе`: треки (``list[types.Track]``). `Если раздел не найден или треки отсутствуют`: ``None``.
         """
 
         return await self._client.getTracks(
             self.id,
+            hydrate,
         )
 
     get_tracks = getTracks
\ No newline at end of file
@@ -41,6 +41,8 @@ class Track(Base):
 
         lyrics (str, optional): текст трека.
 
+        lyricsTimestamps (list[dict], optional): строки текста трека с временными метками в формате {"line": str, "begin": int, "end": int}. Доступно только для треков с синхронизированным текстом.
+
         hasLyrics (bool, optional): флаг, указывающий, имеет ли трек текст. Отсутствует, если lyrics не None.
 
         uploadedAt (datetime): дата и время загрузки трека (не релиза).
@@ -84,6 +86,7 @@ class Track(Base):
         'duration',
         'genre',
         'lyrics',
+        'lyricsTimestamps',
         'hasLyrics',
         'uploadedAt',
         'fileUrl',
@@ -105,7 +108,7 @@ class Track(Base):
     from typing import Union, List
 
     from vkmusix.aio import async_
-    from vkmusix.enums import Extension
+    from vkmusix.enums import Extension, Priority
 
     def __init__(self, track: dict, releaseTrack: bool = None, client: "Client" = None) -> None:
         import html
@@ -147,6 +150,7 @@ class Track(Base):
         ) if genreId else None
 
         self.lyrics = track.get("lyrics")
+        self.lyricsTimestamps = track.get("lyrics_timestamps")
         self.hasLyrics = track.get("has_lyrics") if not self.lyrics else None
 
         self.uploadedAt = unixToDatetime(track.get("date"))
@@ -191,6 +195,48 @@ class Track(Base):
         self.raw = track
 
 
+    def __getattr__(self, name: str) -> any:
+        lazyGroup = self.__dict__.get("_lazyGroup")
+
+        if lazyGroup is None or name not in Track.__slots__:
+            raise AttributeError(name)
+
+        from asyncio import get_running_loop
+
+        try:
+            get_running_loop()
+
+        except RuntimeError:
+            self._client.hydrate(lazyGroup)
+
+        else:
+            self._client._raiseError("lazyHydrationInsideEventLoop")
+
+        return object.__getattribute__(self, name)
+
+
+    def _isStub(self) -> bool:
+        if self.__dict__.get("_lazyGroup") is not None:
+            return True
+
+        return self.title is None and self.duration is None
+
+
+    def _makeLazy(self, lazyGroup: List["Track"]) -> None:
+        self.__dict__.pop("_lazyGroup", None)
+
+        for key in self.__slots__:
+            if key not in ("ownerId", "trackId", "id", "url", "raw") and hasattr(self, key):
+                delattr(self, key)
+
+        self.__dict__["_lazyGroup"] = lazyGroup
+
+
+    def _fill(self, track: dict) -> None:
+        self.__dict__.pop("_lazyGroup", None)
+        self.__init__(track, client=self._client)
+
+
     @async_
     async def get(self, includeLyrics: bool = False) -> Union["Track", None]:
         """
@@ -236,13 +282,13 @@ class Track(Base):
 
 
     @async_
-    async def download(self, filename: str = None, directory: str = None, extension: Extension = None, metadata: bool = False) -> Union[str, None]:
+    async def download(self, filename: str = None, directory: str = None, extension: Extension = None, metadata: bool = False, extensions: List[Extension] = None, priority: Priority = None) -> Union[List[str], str, None]:
         """
         Скачивает трек.
 
         `Пример использования`:
 
-        from vkmusix.enums import Extension
+        from vkmusix.enums import Extension, Priority
 
         path = track.download(
             extension=Extension.OPUS,
@@ -255,7 +301,9 @@ class Track(Base):
         :param directory: путь к директории, в которую загрузить трек. (``str``, `optional`)
         :param extension: расширение файла с треком. По умолчанию ``Extension.MP3``. (``enums.Extension``, `optional`)
         :param metadata: флаг, указывающий, необходимо ли добавить метаданные (артист, название, альбом, обложка) к файлу с треком. По умолчанию ``False``. Игнорируется, если параметр ``extension`` равен ``Extension.TS``. (``bool``, `optional`)
-        :return: `При успехе`: полный путь к загруженному файлу (``str``). `Если трек не найден или недоступен для загрузки`: ``None``.
+        :param extensions: расширения файлов с треком. Трек скачивается и декодируется один раз, после чего сохраняется во всех указанных форматах. Если указан, параметр ``extension`` игнорируется. (``list[enums.Extension]``, `optional`)
+        :param priority: приоритет скачивания при ограничении скорости через ``downloadLimit``. По умолчанию ``Priority.Normal``. Используйте ``Priority.Low`` для массовых фоновых загрузок. (``enums.Priority``, `optional`)
+        :return: `При успехе`: полный путь к загруженному файлу (``str``), или полные пути к загруженным файлам в порядке ``extensions`` (``list[str]``), если указан параметр ``extensions``. `Если трек не найден или недоступен для загрузки`: ``None``.
         """
 
         return await self._client.download(
@@ -264,6 +312,8 @@ class Track(Base):
             extension=extension,
             metadata=metadata,
             track=self,
+            extensions=extensions,
+            priority=priority,
         )
 
 
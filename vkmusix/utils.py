@@ -17,9 +17,13 @@
 #  along with VKMusix. If not, see <http://www.gnu.org/licenses/>.
 
 import os
+import re
 import platform
+import asyncio
 
-from typing import Union
+from typing import Union, List, Tuple, FrozenSet, Iterable, Iterator, Awaitable, Hashable
+from itertools import islice
+from bisect import bisect_left
 
 from datetime import datetime
 
@@ -53,4 +57,114 @@ def checkFile(filename: str) -> Union[str, None]:
 
     filename = fileExistsCaseInsensitive(filename)
     if not filename:
-        return
\ No newline at end of file
+        return
+
+
+def normalizeText(value: Union[str, None]) -> str:
+    if not value:
+        return ""
+
+    return " ".join(re.sub(r"[\W_]+", " ", value.casefold().replace("ё", "е")).split())
+
+
+transliterationTable = str.maketrans({
+    "а": "a", "б": "b", "в": "v", "г": "g", "д": "d", "е": "e", "ё": "e", "ж": "zh", "з": "z", "и": "i", "й": "y",
+    "к": "k", "л": "l", "м": "m", "н": "n", "о": "o", "п": "p", "р": "r", "с": "s", "т": "t", "у": "u", "ф": "f",
+    "х": "h", "ц": "ts", "ч": "ch", "ш": "sh", "щ": "sch", "ъ": "", "ы": "y", "ь": "", "э": "e", "ю": "yu", "я": "ya",
+})
+
+
+def cleanTrackText(value: Union[str, None]) -> str:
+    if not value:
+        return ""
+
+    value = re.sub(r"[(\[][^)\]]*[)\]]", " ", value)
+    value = re.sub(r"(?i)\s(feat|ft|featuring|prod)\b.*$", " ", value)
+
+    return " ".join(value.split())
+
+
+def normalizeTrackText(value: Union[str, None]) -> str:
+    return normalizeText(cleanTrackText(value)).translate(transliterationTable)
+
+
+def trigrams(value: str) -> FrozenSet[str]:
+    value = f"  {value} "
+
+    return frozenset(value[i:i + 3] for i in range(len(value) - 2))
+
+
+def similarity(first: FrozenSet[str], second: FrozenSet[str]) -> float:
+    if not first or not second:
+        return 0.0
+
+    return 2 * len(first & second) / (len(first) + len(second))
+
+
+def chunks(iterable: Iterable[any], size: int) -> Iterator[List[any]]:
+    iterator = iter(iterable)
+    for first in iterator:
+        yield [first] + list(islice(iterator, size - 1))
+
+
+async def gatherWithConcurrency(coroutines: Iterable[Awaitable[any]], limit: Union[int, None] = None, returnExceptions: bool = False) -> List[any]:
+    if not limit or limit < 1:
+        return list(await asyncio.gather(*coroutines, return_exceptions=returnExceptions))
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coroutine: Awaitable[any]) -> any:
+        async with semaphore:
+            return await coroutine
+
+    return list(await asyncio.gather(*(run(coroutine) for coroutine in coroutines), return_exceptions=returnExceptions))
+
+
+def planReorder(currentIds: List[Hashable], desiredIds: List[Hashable]) -> List[List[Tuple[Hashable, Union[Hashable, None], Union[Hashable, None]]]]:
+    desiredPositions = {id: position for position, id in enumerate(desiredIds)}
+    positions = [desiredPositions[id] for id in currentIds if id in desiredPositions]
+
+    # Наибольшая возрастающая подпоследовательность — элементы, которые уже стоят в нужном порядке и могут остаться на месте
+    tails, tailIndexes, previous = list(), list(), [None] * len(positions)
+
+    for index, position in enumerate(positions):
+        tailIndex = bisect_left(tails, position)
+
+        if tailIndex == len(tails):
+            tails.append(position)
+            tailIndexes.append(index)
+
+        else:
+            tails[tailIndex] = position
+            tailIndexes[tailIndex] = index
+
+        previous[index] = tailIndexes[tailIndex - 1] if tailIndex else None
+
+    staying = set()
+    index = tailIndexes[-1] if tailIndexes else None
+
+    while index is not None:
+        staying.add(desiredIds[positions[index]])
+        index = previous[index]
+
+    currentIdsSet = set(currentIds)
+    present = [id for id in desiredIds if id in currentIdsSet]
+
+    # Перемещения группируются в цепочки (id, before, after): элементы между двумя остающимися на месте ставятся перед следующим из них,
+    # поэтому внутри цепочки порядок важен, а разные цепочки не зависят друг от друга
+    moves, chain = list(), list()
+
+    for id in present:
+        if id not in staying:
+            chain.append(id)
+            continue
+
+        if chain:
+            moves.append([(chainId, id, None) for chainId in chain])
+            chain = list()
+
+    if chain:
+        anchorId = present[-len(chain) - 1]
+        moves.append([(chainId, None, afterId) for chainId, afterId in zip(chain, [anchorId] + chain[:-1])])
+
+    return moves
\ No newline at end of file
@@ -18,6 +18,7 @@
 
 from typing import Union
 import asyncio
+import os
 import re
 import json as jsonlib
 from enum import Enum
@@ -25,10 +26,13 @@ from enum import Enum
 import httpx
 
 from vkmusix import aio
+from vkmusix.enums import Priority
+from vkmusix.limiter import TokenBucket
 
 retries = 5
 timeout = 20
 sleepTime = .25
+throttledChunkSize = 64 * 1024
 
 def addHTTPsToUrl(url: str) -> str:
     if not ('https://' in url or 'http://' in url):
@@ -46,9 +50,77 @@ class Method(Enum):
     GET = 'GET'
     POST = 'POST'
 
+class ThrottledStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, limiter: TokenBucket, priority: Priority) -> None:
+        self.stream = stream
+        self.limiter = limiter
+        self.priority = priority
+
+    async def __aiter__(self) -> any:
+        async for chunk in self.stream:
+            for start in range(0, len(chunk), throttledChunkSize):
+                part = chunk[start:start + throttledChunkSize]
+                await self.limiter.acquire(len(part), self.priority)
+                yield part
+
+    async def aclose(self) -> None:
+        if hasattr(self.stream, "aclose"):
+            await self.stream.aclose()
+
+class MultipartStream:
+    def __init__(self, name: str, filename: str, contentType: str, source: callable, size: int = None, rewind: callable = None) -> None:
+        boundary = os.urandom(16).hex()
+        filename = os.path.basename(filename).replace('"', "%22")
+
+        self.header = f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\nContent-Type: {contentType}\r\n\r\n'.encode()
+        self.footer = f"\r\n--{boundary}--\r\n".encode()
+        self.source = source
+        self._rewind = rewind
+        self._started = False
+
+        self.headers = {
+            "Content-Type": f"multipart/form-data; boundary={boundary}",
+            **({
+                "Content-Length": str(len(self.header) + size + len(self.footer)),
+            } if size is not None else dict()),
+        }
+
+    async def rewind(self) -> bool:
+        if not self._started:
+            return True
+
+        if not self._rewind:
+            return False
+
+        try:
+            result = self._rewind()
+
+            if asyncio.iscoroutine(result):
+                result = await result
+
+        except (OSError, ValueError):
+            return False
+
+        self._started = False
+
+        return result is not False
+
+    async def __aiter__(self) -> any:
+        self._started = True
+
+        yield self.header
+
+        async for chunk in self.source():
+            yield chunk
+
+        yield self.footer
+
 class Client:
-    def __init__(self, client: httpx.AsyncClient = None) -> None:
+    def __init__(self, client: httpx.AsyncClient = None, downloadLimiter: TokenBucket = None, uploadLimiter: TokenBucket = None, loopThread: aio.LoopThread = None) -> None:
         self.client = client or httpx.AsyncClient()
+        self.downloadLimiter = downloadLimiter or TokenBucket()
+        self.uploadLimiter = uploadLimiter or TokenBucket()
+        self._loopThread = loopThread
 
     @aio.async_
     async def __call__(
@@ -62,6 +134,8 @@ class Client:
         files: dict = None,
         responseType: ResponseType = ResponseType.JSON,
         method: Method = Method.GET,
+        priority: Priority = Priority.Normal,
+        content: any = None,
     ) -> any:
         retriesLocal = retries
 
@@ -74,19 +148,53 @@ class Client:
             cookies = cookies_
 
         while retriesLocal > 0:
+            # Тело из файлового объекта или асинхронного итератора нельзя отправить повторно, если его не удалось перемотать в начало
+            if isinstance(content, MultipartStream) and not await content.rewind():
+                return
+
             try:
-                response = await self.client.request(
-                    method.value,
-                    url,
-                    params=params,
-                    json=json,
-                    data=data,
-                    cookies=cookies,
-                    headers=headers,
-                    files=files,
-                    timeout=httpx.Timeout(timeout),
-                    follow_redirects=False,
-                )
+                if self.downloadLimiter.rate or self.uploadLimiter.rate:
+                    request = self.client.build_request(
+                        method.value,
+                        url,
+                        content=content,
+                        params=params,
+                        json=json,
+                        data=data,
+                        cookies=cookies,
+                        headers=headers,
+                        files=files,
+                        timeout=httpx.Timeout(timeout),
+                    )
+
+                    if self.uploadLimiter.rate:
+                        request.stream = ThrottledStream(request.stream, self.uploadLimiter, priority)
+
+                    response = await self.client.send(request, stream=True, follow_redirects=False)
+
+                    if self.downloadLimiter.rate:
+                        response.stream = ThrottledStream(response.stream, self.downloadLimiter, priority)
+
+                    try:
+                        await response.aread()
+
+                    finally:
+                        await response.aclose()
+
+                else:
+                    response = await self.client.request(
+                        method.value,
+                        url,
+                        content=content,
+                        params=params,
+                        json=json,
+                        data=data,
+                        cookies=cookies,
+                        headers=headers,
+                        files=files,
+                        timeout=httpx.Timeout(timeout),
+                        follow_redirects=False,
+                    )
 
                 if responseType == ResponseType.JSON:
                     try: